@@ -7,11 +7,12 @@ enabling cross-game asset transfers and blockchain operations.
 
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List, Callable, Union
+from typing import Dict, Any, Optional, List, Callable, Union, Awaitable, AsyncIterator
 
 from .core import (
     InterverseChain,
     InterverseAsset,
+    AssetBatch,
     InterverseWallet,
     WalletManager,
     ItemCategory,
@@ -24,11 +25,19 @@ from .core import (
     PlayerIdentity,
     GameRegistration,
     ChainResponse,
-    ChainResponseStatus
+    ChainResponseStatus,
+    RequestBatch,
+    enable_background_logging
 )
+from .core.batch import get_active_batch
+from .core.cache import TTLCache
+from .core.compat import install_uvloop
 
 __version__ = "0.1.0"
 
+# Result of a batchable read: the response dict, or a future for it inside sdk.batch()
+BatchableResult = Union[Dict[str, Any], asyncio.Future]
+
 class Interverse:
     """
     Main entry point for the Interverse SDK.
@@ -41,7 +50,9 @@ class Interverse:
         self, 
         game_id: str = "", 
         api_key: str = "", 
-        node_url: str = "https://verse-coin-7b67e4d49b53.herokuapp.com"
+        node_url: str = "https://verse-coin-7b67e4d49b53.herokuapp.com",
+        share_session: bool = False,
+        http2: bool = False
     ):
         """
         Initialize the Interverse SDK.
@@ -50,13 +61,30 @@ class Interverse:
             game_id: The ID of your game
             api_key: Your API key for the Interverse blockchain
             node_url: The URL of the Interverse blockchain node
+            share_session: Share one HTTP connection pool with every other
+                SDK instance using the same node and API key
+            http2: Send API requests over HTTP/2 so concurrent calls share
+                one connection (requires the ``http2`` extra)
         """
-        self.chain = InterverseChain(node_url=node_url, game_id=game_id, api_key=api_key)
+        self.chain = InterverseChain(
+            node_url=node_url, 
+            game_id=game_id, 
+            api_key=api_key, 
+            share_session=share_session,
+            http2=http2
+        )
         self.wallet_manager = WalletManager(self.chain)
         self._initialized = False
         self._connected = False
         
+        # Short-lived balance cache (assets are cached by the chain)
+        self._balance_cache = TTLCache(maxsize=1024, ttl=2.0)
+        
+        # Keep the cache coherent with server-pushed updates
+        self.chain.on("balance_updated", self._on_balance_event, inline=True)
+        
         # Configure logging
+        enable_background_logging()
         self.logger = logging.getLogger("interverse")
     
     async def initialize(self) -> bool:
@@ -67,10 +95,14 @@ class Interverse:
             bool: True if initialization was successful, False otherwise
         """
         try:
-            if await self.chain.initialize():
+            # Load existing wallets from disk while the HTTP session is set up
+            loop = asyncio.get_running_loop()
+            chain_ok, _ = await asyncio.gather(
+                self.chain.initialize(),
+                loop.run_in_executor(None, self.wallet_manager.storage.load_wallets)
+            )
+            if chain_ok:
                 self._initialized = True
-                # Load existing wallets
-                self.wallet_manager.storage.load_wallets()
                 return True
             return False
         except Exception as e:
@@ -113,15 +145,18 @@ class Interverse:
         except Exception as e:
             self.logger.error(f"Close error: {e}")
     
-    def on(self, event_name: str, callback: Callable) -> None:
+    def on(self, event_name: str, callback: Callable, threaded: bool = False) -> None:
         """
         Register an event handler.
         
         Args:
             event_name: Name of the event to listen for
-            callback: Function to call when the event occurs
+            callback: Function or coroutine function to call when the event
+                occurs. Handlers run as separate tasks on the event loop.
+            threaded: Run a plain function in a small thread pool instead of
+                on the event loop, for blocking handlers that are thread-safe
         """
-        self.chain.on(event_name, callback)
+        self.chain.on(event_name, callback, threaded=threaded)
     
     def off(self, event_name: str, callback: Callable) -> None:
         """
@@ -133,6 +168,48 @@ class Interverse:
         """
         self.chain.off(event_name, callback)
     
+    def batch(self) -> RequestBatch:
+        """
+        Create a request batch.
+        
+        Read calls (get_balance, get_asset, get_player_assets,
+        get_transaction_history) made inside ``async with sdk.batch():``
+        return futures and are all dispatched concurrently when the block
+        exits. Each ``input_from`` dependency adds a round trip.
+        
+        Returns:
+            RequestBatch to use as an async context manager
+        """
+        return RequestBatch()
+    
+    async def _dispatch(self, method: Callable, *args: Any, input_from: Optional[int] = None) -> Any:
+        """Queue the call in the active batch, or run it right away"""
+        batch = get_active_batch()
+        if batch is not None:
+            return batch.add(method, args, input_from)
+        return await method(*args)
+    
+    async def _get_balance_cached(self, address: str) -> Dict[str, Any]:
+        """Get a balance, answering from the cache while it is fresh"""
+        cached = self._balance_cache.get(address)
+        if cached is not None:
+            return cached
+            
+        result = await self.chain.get_balance(address)
+        if result.get("success", False):
+            self._balance_cache[address] = result
+        return result
+    
+    def _on_balance_event(self, data: Dict[str, Any]) -> None:
+        """Refresh the cached balance of an address"""
+        address = data.get("address")
+        if address:
+            self._balance_cache[address] = {
+                "success": True,
+                "address": address,
+                "balance": data.get("balance", 0.0)
+            }
+    
     async def create_wallet(self) -> Dict[str, Any]:
         """
         Create a new wallet on the blockchain.
@@ -155,17 +232,18 @@ class Interverse:
             "error": error
         }
     
-    async def get_balance(self, address: str) -> Dict[str, Any]:
+    async def get_balance(self, address: str, input_from: Optional[int] = None) -> BatchableResult:
         """
         Get the balance of a wallet.
         
         Args:
             address: Wallet address
+            input_from: Inside a batch, index of the call whose result feeds address
             
         Returns:
-            Dict containing balance information
+            Dict containing balance information (a future inside a batch)
         """
-        return await self.chain.get_balance(address)
+        return await self._dispatch(self._get_balance_cached, address, input_from=input_from)
     
     async def mint_asset(self, owner_address: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -178,7 +256,10 @@ class Interverse:
         Returns:
             Dict containing the minted asset information
         """
-        return await self.chain.mint_asset(owner_address, properties)
+        result = await self.chain.mint_asset(owner_address, properties)
+        if result.get("success", False):
+            self._balance_cache.pop(owner_address)
+        return result
     
     async def transfer_asset(self, asset_id: str, from_address: str, to_address: str) -> Dict[str, Any]:
         """
@@ -192,31 +273,132 @@ class Interverse:
         Returns:
             Dict containing transfer result
         """
-        return await self.chain.transfer_asset(asset_id, from_address, to_address)
+        result = await self.chain.transfer_asset(asset_id, from_address, to_address)
+        if result.get("success", False):
+            self._balance_cache.pop(from_address)
+            self._balance_cache.pop(to_address)
+        return result
     
-    async def get_asset(self, asset_id: str) -> Dict[str, Any]:
+    async def get_asset(self, asset_id: str, input_from: Optional[int] = None) -> BatchableResult:
         """
         Get details of a specific asset.
         
         Args:
             asset_id: ID of the asset
+            input_from: Inside a batch, index of the call whose result feeds asset_id
             
         Returns:
-            Dict containing asset details
+            Dict containing asset details (a future inside a batch)
         """
-        return await self.chain.get_asset(asset_id)
+        return await self._dispatch(self.chain.get_asset, asset_id, input_from=input_from)
     
-    async def get_player_assets(self, address: str) -> Dict[str, Any]:
+    async def get_player_assets(
+        self, 
+        address: str, 
+        input_from: Optional[int] = None, 
+        as_objects: bool = False
+    ) -> BatchableResult:
         """
         Get all assets owned by a player.
         
         Args:
             address: Player wallet address
+            input_from: Inside a batch, index of the call whose result feeds address
+            as_objects: Return the assets as InterverseAsset instances instead of
+                raw dictionaries
             
         Returns:
-            Dict containing list of assets
+            Dict containing list of assets (a future inside a batch)
+        """
+        method = self._get_player_asset_objects if as_objects else self.chain.get_player_assets
+        return await self._dispatch(method, address, input_from=input_from)
+    
+    async def _get_player_asset_objects(self, address: str) -> Dict[str, Any]:
+        """Get all assets owned by a player as InterverseAsset instances"""
+        result = await self.chain.get_player_assets(address)
+        if result.get("success", False):
+            # Copy rather than mutate: the result may be shared with other callers
+            result = {**result, "assets": InterverseAsset.from_dict_batch(result.get("assets", []))}
+        return result
+    
+    async def iter_player_assets(self, address: str, page_size: int = 100) -> AsyncIterator[InterverseAsset]:
+        """
+        Iterate over all assets owned by a player, one page at a time.
+        
+        The next page is requested while the current one is consumed, so only
+        about two pages are held in memory instead of the whole inventory.
+        
+        Args:
+            address: Player wallet address
+            page_size: Number of assets requested per page
+            
+        Yields:
+            InterverseAsset instances
+            
+        Raises:
+            RuntimeError: If a page could not be fetched
+        """
+        async for page in self._iter_pages(self.chain.get_player_assets, address, "assets", page_size):
+            for asset in InterverseAsset.from_dict_batch(page):
+                yield asset
+    
+    async def iter_transaction_history(self, address: str, page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over the transaction history of an address, one page at a time.
+        
+        Args:
+            address: Wallet address
+            page_size: Number of transactions requested per page
+            
+        Yields:
+            Transaction dictionaries
+            
+        Raises:
+            RuntimeError: If a page could not be fetched
         """
-        return await self.chain.get_player_assets(address)
+        async for page in self._iter_pages(self.chain.get_transaction_history, address, "transactions", page_size):
+            for transaction in page:
+                yield transaction
+    
+    async def _iter_pages(
+        self, 
+        fetch: Callable[..., Awaitable[Dict[str, Any]]], 
+        address: str, 
+        key: str, 
+        page_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of a paginated listing, prefetching the next page"""
+        offset = 0
+        first_item = None
+        pending = asyncio.ensure_future(fetch(address, offset, page_size))
+        
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                if not result.get("success", False):
+                    raise RuntimeError(result.get("error", f"Failed to fetch {key}"))
+                    
+                page = result.get(key, [])
+                if not page:
+                    return
+                    
+                # A node without pagination support returns the full listing
+                # (or the same first page again); stop instead of repeating it
+                if offset and page[0] == first_item:
+                    return
+                if first_item is None:
+                    first_item = page[0]
+                    
+                # Request the next page before handing this one to the caller
+                offset += len(page)
+                if len(page) == page_size:
+                    pending = asyncio.ensure_future(fetch(address, offset, page_size))
+                    
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
     
     async def update_asset(self, asset_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -231,17 +413,18 @@ class Interverse:
         """
         return await self.chain.update_asset(asset_id, properties)
     
-    async def get_transaction_history(self, address: str) -> Dict[str, Any]:
+    async def get_transaction_history(self, address: str, input_from: Optional[int] = None) -> BatchableResult:
         """
         Get transaction history for an address.
         
         Args:
             address: Wallet address
+            input_from: Inside a batch, index of the call whose result feeds address
             
         Returns:
-            Dict containing transaction history
+            Dict containing transaction history (a future inside a batch)
         """
-        return await self.chain.get_transaction_history(address)
+        return await self._dispatch(self.chain.get_transaction_history, address, input_from=input_from)
     
     async def verify_game(self) -> Dict[str, Any]:
         """
@@ -269,11 +452,33 @@ async def create_interverse_sdk(game_id: str, api_key: str, node_url: str = "htt
     await sdk.connect()
     return sdk
 
+def run(main: Awaitable[Any], use_uvloop: bool = True) -> Any:
+    """
+    Run a coroutine on the SDK's recommended event loop.
+    
+    The SDK spends most of its time on small network round trips, where
+    uvloop's event loop is considerably faster than the default one. It is
+    used when installed (``pip install interverse-sdk[speedups]``), otherwise
+    this behaves exactly like ``asyncio.run``.
+    
+    Args:
+        main: Coroutine to run, typically your game's async entry point
+        use_uvloop: Use uvloop when it is available
+        
+    Returns:
+        The coroutine's result
+    """
+    if use_uvloop:
+        install_uvloop()
+    return asyncio.run(main)
+
 __all__ = [
     'Interverse',
     'create_interverse_sdk',
+    'run',
     'InterverseChain',
     'InterverseAsset',
+    'AssetBatch',
     'InterverseWallet',
     'ItemCategory',
     'Rarity',
@@ -286,4 +491,6 @@ __all__ = [
     'GameRegistration',
     'ChainResponse',
     'ChainResponseStatus',
+    'RequestBatch',
+    'enable_background_logging',
 ]
\ No newline at end of file
@@ -5,10 +5,16 @@ This module contains the core functionality of the Interverse SDK,
 providing interfaces to interact with the Interverse blockchain.
 """
 
+import atexit
 import logging
-from .chain import InterverseChain
-from .asset import InterverseAsset, ItemCategory, Rarity, Color
+import logging.handlers
+import queue
+import threading
+from typing import Optional
+from .chain import InterverseChain, get_shared_session, close_shared_sessions
+from .asset import InterverseAsset, AssetBatch, ColorView, ItemCategory, Rarity, Color
 from .wallet import InterverseWallet, WalletManager
+from .batch import RequestBatch, AsyncBatcher
 from .types import (
     Transaction, 
     TransactionType, 
@@ -35,12 +41,44 @@ handler.setFormatter(formatter)
 # Add handler to logger
 logger.addHandler(handler)
 
+# Background log writer, started by enable_background_logging()
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def enable_background_logging() -> None:
+    """
+    Write SDK log output from a background thread.
+
+    The SDK's records are then put on a queue by the logging call and
+    written to the console by a listener thread, so slow console output
+    doesn't stall the caller (e.g. the WebSocket read loop). The message
+    text is still built on the calling thread. Called by the Interverse
+    constructor; calling it again has no effect.
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        log_queue: queue.Queue = queue.Queue(-1)
+        _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.removeHandler(handler)
+
 __version__ = "0.1.0"
 __all__ = [
     'InterverseChain',
+    'get_shared_session',
+    'close_shared_sessions',
     'InterverseAsset',
+    'AssetBatch',
+    'ColorView',
     'InterverseWallet',
     'WalletManager',
+    'RequestBatch',
+    'AsyncBatcher',
     'ItemCategory',
     'Rarity',
     'Color',
@@ -51,5 +89,6 @@ __all__ = [
     'PlayerIdentity',
     'GameRegistration',
     'ChainResponse',
-    'ChainResponseStatus'
+    'ChainResponseStatus',
+    'enable_background_logging'
 ]
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+msgspec wire schemas used to decode raw asset and transaction JSON.
+
+These live outside core/asset.py because that module can be compiled with
+mypyc, which does not compile conditionally defined classes or subclasses of
+msgspec.Struct (a third-party metaclass) as native classes. This module is
+always imported as plain Python. The decoders are None when msgspec is not
+installed.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from .compat import msgspec
+
+ASSET_DECODER: Any = None
+ASSET_LIST_DECODER: Any = None
+TRANSACTION_DECODER: Any = None
+TRANSACTION_LIST_DECODER: Any = None
+DECODE_ERRORS: tuple = (json.JSONDecodeError,)
+
+if msgspec is not None:
+    class ColorSchema(msgspec.Struct):
+        """Wire schema of a Color"""
+        r: float = 1.0
+        g: float = 1.0
+        b: float = 1.0
+        a: float = 1.0
+
+    class AssetSchema(msgspec.Struct):
+        """Wire schema of an InterverseAsset"""
+        asset_id: Optional[str] = None
+        owner: Optional[str] = None
+        game_id: Optional[str] = None
+        # Loosely typed fields are normalized as in from_dict. UNSET tells an
+        # absent category (blockchain API format) from an explicit null.
+        category: Any = msgspec.UNSET
+        rarity: Any = None
+        level: Any = 1
+        model_id: Any = ""
+        primary_color: Optional[ColorSchema] = None
+        secondary_color: Optional[ColorSchema] = None
+        numeric_properties: Optional[Dict[str, Any]] = None
+        string_properties: Optional[Dict[str, Any]] = None
+        tags: Optional[List[str]] = None
+        source_game: Optional[str] = None
+        conversion_history: Optional[List[Dict[str, Any]]] = None
+        metadata: Any = None
+
+    class TransactionSchema(msgspec.Struct):
+        """Wire schema of a Transaction (loosely typed fields are normalized as in from_dict)"""
+        id: Any = None
+        sender_address: Any = ""
+        recipient_address: Any = ""
+        amount: float = 0.0
+        transaction_type: Any = None
+        status: Any = None
+        timestamp: Any = None
+        metadata: Optional[Dict[str, Any]] = None
+        block_number: Any = None
+
+    # strict=False lets numeric strings through as numbers, like from_dict's int()/float()
+    ASSET_DECODER = msgspec.json.Decoder(AssetSchema, strict=False)
+    ASSET_LIST_DECODER = msgspec.json.Decoder(List[AssetSchema], strict=False)
+    TRANSACTION_DECODER = msgspec.json.Decoder(TransactionSchema, strict=False)
+    TRANSACTION_LIST_DECODER = msgspec.json.Decoder(List[TransactionSchema], strict=False)
+    DECODE_ERRORS = (msgspec.DecodeError, json.JSONDecodeError)
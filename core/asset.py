@@ -1,9 +1,14 @@
+from array import array
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
+import datetime
 import json
 import logging
 
+from .compat import DATACLASS_SLOTS, json_dumps, json_loads, msgpack_dumps, msgpack_loads, msgspec
+from ._schemas import ASSET_DECODER, ASSET_LIST_DECODER, DECODE_ERRORS
+
 logger = logging.getLogger("interverse.asset")
 
 class ItemCategory(str, Enum):
@@ -20,11 +25,7 @@ class ItemCategory(str, Enum):
     @classmethod
     def from_string(cls, category_str: str) -> 'ItemCategory':
         """Convert string to ItemCategory enum"""
-        category_str = category_str.lower()
-        for category in cls:
-            if category.value.lower() == category_str:
-                return category
-        return cls.COSMETIC  # Default to COSMETIC if not found
+        return _CATEGORY_LOOKUP.get(category_str.lower(), cls.COSMETIC)  # Default to COSMETIC if not found
 
 class Rarity(str, Enum):
     """Standard rarity levels across all games"""
@@ -38,13 +39,30 @@ class Rarity(str, Enum):
     @classmethod
     def from_string(cls, rarity_str: str) -> 'Rarity':
         """Convert string to Rarity enum"""
-        rarity_str = rarity_str.lower()
-        for rarity in cls:
-            if rarity.value.lower() == rarity_str:
-                return rarity
-        return cls.COMMON  # Default to COMMON if not found
+        return _RARITY_LOOKUP.get(rarity_str.lower(), cls.COMMON)  # Default to COMMON if not found
+
+# Lowercased value -> member tables used by from_string and from_dict
+_CATEGORY_LOOKUP: Dict[str, ItemCategory] = {c.value.lower(): c for c in ItemCategory}
+_RARITY_LOOKUP: Dict[str, Rarity] = {r.value.lower(): r for r in Rarity}
+
+
+def _category_of(value: Any) -> Optional[ItemCategory]:
+    """Look up a category value from asset data (None/empty means COSMETIC, unknown or non-string values None)"""
+    if not value:
+        return ItemCategory.COSMETIC
+    return _CATEGORY_LOOKUP.get(value.lower()) if isinstance(value, str) else None
+
+
+def _rarity_of(value: Any) -> Optional[Rarity]:
+    """Look up a rarity value from asset data (None/empty means COMMON, unknown or non-string values None)"""
+    if not value:
+        return Rarity.COMMON
+    return _RARITY_LOOKUP.get(value.lower()) if isinstance(value, str) else None
 
-@dataclass
+# Scale factor from an 8-bit channel value to a 0.0-1.0 float
+_INV_255 = 1.0 / 255.0
+
+@dataclass(**DATACLASS_SLOTS)
 class Color:
     """RGBA color representation"""
     r: float = 1.0
@@ -75,25 +93,28 @@ class Color:
     def from_hex(cls, hex_color: str) -> 'Color':
         """Create Color from hex string (e.g., '#FF0000' for red)"""
         hex_color = hex_color.lstrip('#')
+        length = len(hex_color)
         
-        if len(hex_color) == 3:  # Shorthand #RGB
-            r = int(hex_color[0] + hex_color[0], 16) / 255.0
-            g = int(hex_color[1] + hex_color[1], 16) / 255.0
-            b = int(hex_color[2] + hex_color[2], 16) / 255.0
-            return cls(r=r, g=g, b=b)
+        if length == 3:  # Shorthand #RGB, expanded to #RRGGBB
+            hex_color = hex_color[0] * 2 + hex_color[1] * 2 + hex_color[2] * 2
+            length = 6
             
-        elif len(hex_color) == 6:  # Standard #RRGGBB
-            r = int(hex_color[0:2], 16) / 255.0
-            g = int(hex_color[2:4], 16) / 255.0
-            b = int(hex_color[4:6], 16) / 255.0
-            return cls(r=r, g=g, b=b)
+        if length == 6:  # Standard #RRGGBB
+            n = int(hex_color, 16)
+            return cls(
+                r=((n >> 16) & 0xFF) * _INV_255,
+                g=((n >> 8) & 0xFF) * _INV_255,
+                b=(n & 0xFF) * _INV_255
+            )
             
-        elif len(hex_color) == 8:  # #RRGGBBAA with alpha
-            r = int(hex_color[0:2], 16) / 255.0
-            g = int(hex_color[2:4], 16) / 255.0
-            b = int(hex_color[4:6], 16) / 255.0
-            a = int(hex_color[6:8], 16) / 255.0
-            return cls(r=r, g=g, b=b, a=a)
+        elif length == 8:  # #RRGGBBAA with alpha
+            n = int(hex_color, 16)
+            return cls(
+                r=((n >> 24) & 0xFF) * _INV_255,
+                g=((n >> 16) & 0xFF) * _INV_255,
+                b=((n >> 8) & 0xFF) * _INV_255,
+                a=(n & 0xFF) * _INV_255
+            )
             
         else:
             raise ValueError(f"Invalid hex color format: {hex_color}")
@@ -105,7 +126,7 @@ class Color:
         else:
             return f"#{int(self.r * 255):02x}{int(self.g * 255):02x}{int(self.b * 255):02x}"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InterverseAsset:
     """Standard asset representation across all platforms"""
     # Required identifiers
@@ -134,13 +155,18 @@ class InterverseAsset:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for blockchain transactions"""
-        result = {
-            "category": self.category.value,
-            "rarity": self.rarity.value,
+        primary = self.primary_color
+        secondary = self.secondary_color
+        
+        # Colors are inlined and enum values read from _value_ directly,
+        # avoiding a method call and the Enum.value descriptor per field
+        result: Dict[str, Any] = {
+            "category": self.category._value_,
+            "rarity": self.rarity._value_,
             "level": self.level,
             "model_id": self.model_id,
-            "primary_color": self.primary_color.to_dict(),
-            "secondary_color": self.secondary_color.to_dict(),
+            "primary_color": {"r": primary.r, "g": primary.g, "b": primary.b, "a": primary.a},
+            "secondary_color": {"r": secondary.r, "g": secondary.g, "b": secondary.b, "a": secondary.a},
             "numeric_properties": self.numeric_properties,
             "string_properties": self.string_properties,
             "tags": self.tags
@@ -162,7 +188,11 @@ class InterverseAsset:
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return json_dumps(self.to_dict())
+    
+    def to_msgpack(self) -> bytes:
+        """Convert to msgpack bytes (requires msgpack)"""
+        return msgpack_dumps(self.to_dict())
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'InterverseAsset':
@@ -171,21 +201,14 @@ class InterverseAsset:
         primary_color = Color.from_dict(data.get("primary_color", {})) if "primary_color" in data else Color()
         secondary_color = Color.from_dict(data.get("secondary_color", {})) if "secondary_color" in data else Color()
         
-        # Handle category and rarity
-        category_str = data.get("category", "cosmetic")
-        rarity_str = data.get("rarity", "common")
+        # Handle category and rarity (unknown values fall back to the defaults)
+        category = _category_of(data.get("category")) or ItemCategory.COSMETIC
+        rarity = _rarity_of(data.get("rarity")) or Rarity.COMMON
         
-        try:
-            category = ItemCategory.from_string(category_str)
-        except Exception as e:
-            logger.warning(f"Invalid category: {category_str}, using default")
-            category = ItemCategory.COSMETIC
-            
-        try:
-            rarity = Rarity.from_string(rarity_str)
-        except Exception as e:
-            logger.warning(f"Invalid rarity: {rarity_str}, using default")
-            rarity = Rarity.COMMON
+        # JSON parsers already return ints; only coerce other types
+        level = data.get("level", 1)
+        if type(level) is not int:
+            level = int(level)
         
         # Create asset object
         return cls(
@@ -194,7 +217,7 @@ class InterverseAsset:
             game_id=data.get("game_id"),
             category=category,
             rarity=rarity,
-            level=int(data.get("level", 1)),
+            level=level,
             model_id=data.get("model_id", ""),
             primary_color=primary_color,
             secondary_color=secondary_color,
@@ -205,16 +228,162 @@ class InterverseAsset:
             conversion_history=data.get("conversion_history", [])
         )
     
+    @classmethod
+    def from_dict_batch(cls, items: List[Dict[str, Any]]) -> List['InterverseAsset']:
+        """
+        Create assets from a list of dictionaries in a single pass.
+
+        Items without a category (the blockchain API format) have their
+        metadata dict merged in first, as in from_blockchain_format; other
+        items give the same asset as from_dict. Unlike from_blockchain_format,
+        no _original_data snapshot is kept. The lookup tables and
+        constructors are bound once for the whole batch.
+
+        Strings that repeat across an inventory (owner, game ids, model ids,
+        tags and property names) are shared between the assets of the batch
+        instead of each asset holding its own copy.
+        """
+        color_from_dict = Color.from_dict
+        default_category = ItemCategory.COSMETIC
+        default_rarity = Rarity.COMMON
+        shared: Dict[Any, Any] = {}
+        share = shared.setdefault
+
+        assets: List["InterverseAsset"] = []
+        append = assets.append
+        unknown = 0
+        for data in items:
+            if "category" not in data:
+                metadata = data.get("metadata")
+                if isinstance(metadata, dict):
+                    data = {**data, **metadata}
+            get = data.get
+
+            primary_color = get("primary_color")
+            secondary_color = get("secondary_color")
+            category = _category_of(get("category"))
+            rarity = _rarity_of(get("rarity"))
+            if category is None or rarity is None:
+                unknown += 1
+                category = category or default_category
+                rarity = rarity or default_rarity
+            level = get("level", 1)
+            if type(level) is not int:
+                level = int(level)
+            owner = get("owner")
+            game_id = get("game_id")
+            source_game = get("source_game")
+            model_id = get("model_id", "")
+            numeric_properties = get("numeric_properties")
+            string_properties = get("string_properties")
+            tags = get("tags")
+
+            append(cls(
+                asset_id=get("asset_id"),
+                owner=share(owner, owner),
+                game_id=share(game_id, game_id),
+                category=category,
+                rarity=rarity,
+                level=level,
+                model_id=share(model_id, model_id),
+                primary_color=color_from_dict(primary_color) if primary_color is not None else Color(),
+                secondary_color=color_from_dict(secondary_color) if secondary_color is not None else Color(),
+                numeric_properties={share(k, k): v for k, v in numeric_properties.items()} if numeric_properties else {},
+                string_properties={share(k, k): share(v, v) for k, v in string_properties.items()} if string_properties else {},
+                tags=[share(t, t) for t in tags] if tags else [],
+                source_game=share(source_game, source_game),
+                conversion_history=get("conversion_history", [])
+            ))
+
+        if unknown:
+            # One summary line per batch instead of one warning per record
+            logger.warning("%d of %d assets had an unknown category or rarity, using defaults",
+                           unknown, len(assets))
+        return assets
+
     @classmethod
     def from_json(cls, json_str: str) -> 'InterverseAsset':
         """Create asset from JSON string"""
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
             return cls.from_dict(data)
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON for asset: {e}")
+            logger.error("Invalid JSON for asset: %s", e)
+            raise ValueError(f"Invalid JSON format: {e}")
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> 'InterverseAsset':
+        """Create asset from msgpack bytes (requires msgpack)"""
+        try:
+            return cls.from_dict(msgpack_loads(data))
+        except (ValueError, TypeError) as e:
+            logger.error("Invalid msgpack for asset: %s", e)
+            raise ValueError(f"Invalid msgpack format: {e}")
+    
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str]) -> 'InterverseAsset':
+        """
+        Create asset from a raw JSON document.
+
+        Equivalent to from_json. With msgspec installed the document is
+        decoded straight into a typed schema in native code, skipping the
+        intermediate dict.
+        """
+        try:
+            if msgspec is None:
+                return cls.from_dict(json_loads(data))
+            return cls._from_schema(ASSET_DECODER.decode(data))
+        except DECODE_ERRORS as e:
+            logger.error("Invalid JSON for asset: %s", e)
+            raise ValueError(f"Invalid JSON format: {e}")
+    
+    @classmethod
+    def from_bytes_batch(cls, data: Union[bytes, str]) -> List['InterverseAsset']:
+        """Create assets from a raw JSON array (equivalent to from_dict_batch, see from_bytes)"""
+        try:
+            if msgspec is None:
+                return cls.from_dict_batch(json_loads(data))
+            from_schema = cls._from_schema
+            unset = msgspec.UNSET
+            assets: List["InterverseAsset"] = []
+            for schema in ASSET_LIST_DECODER.decode(data):
+                if schema.category is unset and isinstance(schema.metadata, dict):
+                    # Blockchain API format; let from_dict_batch merge the metadata
+                    fields = {k: v for k, v in msgspec.to_builtins(schema).items() if v is not None}
+                    assets.extend(cls.from_dict_batch([fields]))
+                else:
+                    assets.append(from_schema(schema))
+            return assets
+        except DECODE_ERRORS as e:
+            logger.error("Invalid JSON for assets: %s", e)
             raise ValueError(f"Invalid JSON format: {e}")
     
+    @classmethod
+    def _from_schema(cls, schema: Any) -> 'InterverseAsset':
+        """Create asset from a decoded AssetSchema (same rules as from_dict, metadata is ignored)"""
+        level = schema.level
+        if type(level) is not int:
+            level = int(level)
+            
+        primary = schema.primary_color
+        secondary = schema.secondary_color
+        return cls(
+            asset_id=schema.asset_id,
+            owner=schema.owner,
+            game_id=schema.game_id,
+            category=_category_of(schema.category) or ItemCategory.COSMETIC,
+            rarity=_rarity_of(schema.rarity) or Rarity.COMMON,
+            level=level,
+            model_id=schema.model_id,
+            primary_color=Color(primary.r, primary.g, primary.b, primary.a) if primary is not None else Color(),
+            secondary_color=Color(secondary.r, secondary.g, secondary.b, secondary.a) if secondary is not None else Color(),
+            numeric_properties=schema.numeric_properties or {},
+            string_properties=schema.string_properties or {},
+            tags=schema.tags or [],
+            source_game=schema.source_game,
+            conversion_history=schema.conversion_history or []
+        )
+    
     @classmethod
     def from_blockchain_format(cls, blockchain_data: Dict[str, Any]) -> 'InterverseAsset':
         """Create asset from blockchain API response format"""
@@ -240,14 +409,14 @@ class InterverseAsset:
             )
             
             # Store the original data in string properties for reference
-            asset.string_properties["_original_data"] = json.dumps(blockchain_data)
+            asset.string_properties["_original_data"] = json_dumps(blockchain_data)
             return asset
             
         except Exception as e:
-            logger.error(f"Error converting blockchain data: {e}")
+            logger.error("Error converting blockchain data: %s", e)
             # Return minimal asset with original data preserved
             asset = cls()
-            asset.string_properties["_original_data"] = json.dumps(blockchain_data)
+            asset.string_properties["_original_data"] = json_dumps(blockchain_data)
             return asset
     
     def get_numeric_property(self, name: str, default: float = 0.0) -> float:
@@ -282,8 +451,6 @@ class InterverseAsset:
     
     def add_conversion_record(self, from_game: str, to_game: str, timestamp: Optional[str] = None) -> None:
         """Add a record of asset conversion between games"""
-        import datetime
-        
         # Use current time if not provided
         if timestamp is None:
             timestamp = datetime.datetime.utcnow().isoformat()
@@ -296,4 +463,228 @@ class InterverseAsset:
         
         # Update source game to the original if this is the first conversion
         if not self.source_game and len(self.conversion_history) == 1:
-            self.source_game = from_game
\ No newline at end of file
+            self.source_game = from_game
+    
+    @staticmethod
+    def add_conversion_records_batch(
+        assets: List['InterverseAsset'], 
+        from_game: str, 
+        to_game: str, 
+        timestamp: Optional[str] = None
+    ) -> None:
+        """Record the same conversion on many assets, sharing a single timestamp"""
+        if timestamp is None:
+            timestamp = datetime.datetime.utcnow().isoformat()
+            
+        for asset in assets:
+            asset.add_conversion_record(from_game, to_game, timestamp)
+
+class ColorView:
+    """Color-like view onto one RGBA entry of an AssetBatch color column"""
+    __slots__ = ("_colors", "_offset")
+    
+    def __init__(self, colors: array, index: int):
+        self._colors = colors
+        self._offset = index * 4
+    
+    @property
+    def r(self) -> float:
+        return self._colors[self._offset]
+    
+    @r.setter
+    def r(self, value: float) -> None:
+        self._colors[self._offset] = value
+    
+    @property
+    def g(self) -> float:
+        return self._colors[self._offset + 1]
+    
+    @g.setter
+    def g(self, value: float) -> None:
+        self._colors[self._offset + 1] = value
+    
+    @property
+    def b(self) -> float:
+        return self._colors[self._offset + 2]
+    
+    @b.setter
+    def b(self, value: float) -> None:
+        self._colors[self._offset + 2] = value
+    
+    @property
+    def a(self) -> float:
+        return self._colors[self._offset + 3]
+    
+    @a.setter
+    def a(self, value: float) -> None:
+        self._colors[self._offset + 3] = value
+    
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary for API serialization"""
+        r, g, b, a = self._colors[self._offset:self._offset + 4]
+        return {"r": r, "g": g, "b": b, "a": a}
+    
+    def to_color(self) -> Color:
+        """Copy the viewed entry into a standalone Color"""
+        return Color(*self._colors[self._offset:self._offset + 4])
+    
+    def to_hex(self, include_alpha: bool = False) -> str:
+        """Convert to hex string"""
+        return self.to_color().to_hex(include_alpha)
+    
+    def __repr__(self) -> str:
+        return f"ColorView(r={self.r}, g={self.g}, b={self.b}, a={self.a})"
+
+
+class AssetBatch:
+    """
+    Column-oriented container for a large set of assets.
+    
+    The colors of all assets are stored in two flat float32 arrays
+    (``primary_colors`` and ``secondary_colors``, four entries per asset)
+    instead of two Color objects per asset, which takes 16 bytes per color
+    rather than a full Python object. The remaining fields are kept per asset
+    and InterverseAsset instances are only built on access.
+    
+    Color values are rounded to float32 precision. The arrays support the
+    buffer protocol, so with NumPy installed
+    ``numpy.frombuffer(batch.primary_colors, dtype=numpy.float32).reshape(-1, 4)``
+    gives a zero-copy (N, 4) view for vectorized color operations.
+    """
+    __slots__ = ("_records", "primary_colors", "secondary_colors")
+    
+    def __init__(self) -> None:
+        # (asset_id, owner, game_id, category, rarity, level, model_id,
+        #  numeric_properties, string_properties, tags, source_game, conversion_history)
+        self._records: List[tuple] = []
+        self.primary_colors = array("f")
+        self.secondary_colors = array("f")
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __getitem__(self, index: int) -> InterverseAsset:
+        if index < 0:
+            index += len(self._records)
+        (asset_id, owner, game_id, category, rarity, level, model_id,
+         numeric_properties, string_properties, tags, source_game, conversion_history) = self._records[index]
+        offset = index * 4
+        return InterverseAsset(
+            asset_id=asset_id,
+            owner=owner,
+            game_id=game_id,
+            category=category,
+            rarity=rarity,
+            level=level,
+            model_id=model_id,
+            primary_color=Color(*self.primary_colors[offset:offset + 4]),
+            secondary_color=Color(*self.secondary_colors[offset:offset + 4]),
+            numeric_properties=numeric_properties,
+            string_properties=string_properties,
+            tags=tags,
+            source_game=source_game,
+            conversion_history=conversion_history
+        )
+    
+    def __iter__(self):
+        for index in range(len(self._records)):
+            yield self[index]
+    
+    def primary_color(self, index: int) -> ColorView:
+        """Get a view of an asset's primary color"""
+        return ColorView(self.primary_colors, index)
+    
+    def secondary_color(self, index: int) -> ColorView:
+        """Get a view of an asset's secondary color"""
+        return ColorView(self.secondary_colors, index)
+    
+    def append(self, asset: InterverseAsset) -> None:
+        """Add an asset to the batch"""
+        self._records.append((
+            asset.asset_id, asset.owner, asset.game_id, asset.category, asset.rarity,
+            asset.level, asset.model_id, asset.numeric_properties, asset.string_properties,
+            asset.tags, asset.source_game, asset.conversion_history
+        ))
+        primary, secondary = asset.primary_color, asset.secondary_color
+        self.primary_colors.extend((primary.r, primary.g, primary.b, primary.a))
+        self.secondary_colors.extend((secondary.r, secondary.g, secondary.b, secondary.a))
+    
+    @classmethod
+    def from_dicts(cls, items: List[Dict[str, Any]]) -> 'AssetBatch':
+        """Create a batch from asset dictionaries (SDK or blockchain API format)"""
+        batch = cls()
+        records = batch._records
+        primary_colors = batch.primary_colors
+        secondary_colors = batch.secondary_colors
+        
+        for data in items:
+            if "category" not in data:
+                metadata = data.get("metadata")
+                if isinstance(metadata, dict):
+                    data = {**data, **metadata}
+            get = data.get
+            level = get("level", 1)
+            if type(level) is not int:
+                level = int(level)
+            
+            records.append((
+                get("asset_id"),
+                get("owner"),
+                get("game_id"),
+                _category_of(get("category")) or ItemCategory.COSMETIC,
+                _rarity_of(get("rarity")) or Rarity.COMMON,
+                level,
+                get("model_id", ""),
+                get("numeric_properties", {}),
+                get("string_properties", {}),
+                get("tags", []),
+                get("source_game"),
+                get("conversion_history", [])
+            ))
+            
+            for colors, color in ((primary_colors, get("primary_color")), (secondary_colors, get("secondary_color"))):
+                if color:
+                    cget = color.get
+                    colors.extend((cget("r", 1.0), cget("g", 1.0), cget("b", 1.0), cget("a", 1.0)))
+                else:
+                    colors.extend((1.0, 1.0, 1.0, 1.0))
+        
+        return batch
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert every asset to its dictionary form without building asset objects"""
+        result = []
+        primary_colors = self.primary_colors
+        secondary_colors = self.secondary_colors
+        
+        for index, record in enumerate(self._records):
+            (asset_id, owner, game_id, category, rarity, level, model_id,
+             numeric_properties, string_properties, tags, source_game, conversion_history) = record
+            offset = index * 4
+            pr, pg, pb, pa = primary_colors[offset:offset + 4]
+            sr, sg, sb, sa = secondary_colors[offset:offset + 4]
+            
+            data = {
+                "category": category._value_,
+                "rarity": rarity._value_,
+                "level": level,
+                "model_id": model_id,
+                "primary_color": {"r": pr, "g": pg, "b": pb, "a": pa},
+                "secondary_color": {"r": sr, "g": sg, "b": sb, "a": sa},
+                "numeric_properties": numeric_properties,
+                "string_properties": string_properties,
+                "tags": tags
+            }
+            if asset_id:
+                data["asset_id"] = asset_id
+            if owner:
+                data["owner"] = owner
+            if game_id:
+                data["game_id"] = game_id
+            if source_game:
+                data["source_game"] = source_game
+            if conversion_history:
+                data["conversion_history"] = conversion_history
+            result.append(data)
+        
+        return result
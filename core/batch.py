@@ -0,0 +1,188 @@
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger("interverse.batch")
+
+# Batch collecting calls for the current task, if any
+_active_batch: contextvars.ContextVar = contextvars.ContextVar("interverse_batch", default=None)
+
+
+def get_active_batch() -> Optional['RequestBatch']:
+    """Return the batch active in the current context, if any"""
+    return _active_batch.get()
+
+
+class RequestBatch:
+    """
+    Collects SDK calls and dispatches them together.
+
+    While the batch is active (``async with sdk.batch() as batch:``), the
+    read methods of the SDK queue their call and return a future instead of
+    sending a request. When the block exits, all queued calls are sent
+    concurrently over the shared HTTP session, so independent calls take
+    about one round trip of wall time instead of one each. Each call is
+    still its own request.
+
+    A call can depend on an earlier call in the same batch through
+    ``input_from`` (an index into the batch, negative values count back from
+    the call itself). Callable arguments of a dependent call are invoked with
+    the result of the call it depends on, e.g.
+    ``sdk.get_player_assets(lambda r: r["address"], input_from=-1)``.
+    A dependent call is only sent once the call it depends on has
+    finished, so every link in such a chain adds a full round trip.
+    """
+
+    def __init__(self):
+        self._calls: List[Tuple[Callable[..., Awaitable[Any]], tuple, Optional[int], asyncio.Future]] = []
+        self._token = None
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add(self, method: Callable[..., Awaitable[Any]], args: tuple = (),
+            input_from: Optional[int] = None) -> asyncio.Future:
+        """
+        Queue a call in the batch.
+
+        Args:
+            method: Coroutine function to call
+            args: Positional arguments for the call
+            input_from: Index of an earlier call whose result feeds this one
+
+        Returns:
+            Future resolving to the call result once the batch is executed
+        """
+        index = len(self._calls)
+        if input_from is not None:
+            if input_from < 0:
+                input_from += index
+            if not 0 <= input_from < index:
+                raise ValueError("input_from must reference an earlier call in the batch")
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls.append((method, args, input_from, future))
+        return future
+
+    async def execute(self) -> None:
+        """Dispatch all queued calls and resolve their futures"""
+        calls, self._calls = self._calls, []
+        if not calls:
+            return
+
+        async def run(method, args, input_from, future):
+            try:
+                if input_from is not None:
+                    previous = await calls[input_from][3]
+                    args = tuple(arg(previous) if callable(arg) else arg for arg in args)
+                result = await method(*args)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+            if not future.done():
+                future.set_result(result)
+
+        logger.debug("Dispatching batch of %d calls", len(calls))
+        await asyncio.gather(*(run(*call) for call in calls))
+
+    async def __aenter__(self) -> 'RequestBatch':
+        self._token = _active_batch.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        _active_batch.reset(self._token)
+        self._token = None
+
+        if exc_type is not None:
+            # Don't send anything if the block failed
+            for _, _, _, future in self._calls:
+                future.cancel()
+            self._calls = []
+            return False
+
+        await self.execute()
+        return False
+
+
+class AsyncBatcher:
+    """
+    Coalesces individual calls into batched requests.
+
+    Items passed to ``add`` are collected until ``max_size`` items are
+    waiting or ``wait_ms`` milliseconds have passed since the first one, then
+    handed to ``flush`` together. When no batch is in flight the wait is
+    skipped: the batch goes out on the next event loop iteration, carrying
+    only the items added in the same iteration, so a lone call isn't
+    delayed. ``flush`` must return one result per item,
+    in order; each ``add`` call resolves to its own result. If ``flush``
+    raises, every call in that batch raises the same exception.
+    """
+
+    def __init__(self, flush: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_size: int = 32, wait_ms: float = 25):
+        self._flush = flush
+        self.max_size = max_size
+        self.wait = wait_ms / 1000.0
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, item: Any) -> asyncio.Future:
+        """
+        Queue an item for the next batch.
+
+        Returns:
+            Future resolving to the item's result once its batch is flushed
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            # Only wait for more items while earlier batches are still in flight
+            self._timer = loop.call_later(self.wait if self._tasks else 0, self.flush)
+        return future
+
+    def flush(self) -> None:
+        """Send everything queued so far without waiting for the timer"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Flush queued items and wait for every batch in flight"""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, pending: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Send one batch and resolve the futures of its items"""
+        try:
+            results = await self._flush([item for item, _ in pending])
+            if len(results) != len(pending):
+                raise ValueError(f"Batch returned {len(results)} results for {len(pending)} items")
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug("Flushed batch of %d items", len(pending))
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
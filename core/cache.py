@@ -0,0 +1,54 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after a fixed time-to-live"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get a live entry, or default if it is missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+            
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+            
+        self._data.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        
+        # Evict least recently used entries
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove an entry, returning its value if it was still live"""
+        entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+
+_MISSING = object()
@@ -3,21 +3,136 @@ import aiohttp
 import json
 import asyncio
 import logging
+import os
+import random
 import time
-from typing import Dict, Any, Optional, List, Callable, Union
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit, urlunsplit
+from typing import Dict, Any, Optional, List, Callable, Union, Awaitable, Set, Tuple
+
+from .batch import AsyncBatcher
+from .cache import TTLCache
+from .compat import ACCEPT_HEADER, MSGPACK_MEDIA_TYPES, json_dumps, json_loads, msgpack, msgpack_loads
+from .http2 import HTTP2Session
 
 logger = logging.getLogger("interverse.chain")
 
+# Default number of pooled HTTP connections, overridable with RPC_POOL_SIZE
+DEFAULT_POOL_SIZE = 100
+
+# Connections kept open to a single node
+POOL_SIZE_PER_HOST = 32
+
+# Seconds a fetched asset / the game verification is answered from memory
+ASSET_CACHE_TTL = 30.0
+GAME_INFO_TTL = 300.0
+
+# Default per-request limits; on-chain writes get longer to complete
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+WRITE_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=5)
+
+WARMUP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# First delay after a request timeout; doubles with each consecutive timeout
+TIMEOUT_BACKOFF = 0.5
+
+# websockets 14 replaced the extra_headers argument of connect() with additional_headers
+_WS_HEADERS_ARG = "additional_headers" if int(websockets.__version__.split(".")[0]) >= 14 else "extra_headers"
+
+# HTTP/1.1 (aiohttp) or HTTP/2 (httpx) session
+Session = Union[aiohttp.ClientSession, HTTP2Session]
+
+# Sessions shared between InterverseChain instances, keyed by (node_url, api_key, http2)
+_shared_sessions: Dict[Tuple[str, str, bool], Tuple[Session, asyncio.AbstractEventLoop]] = {}
+
+
+def _create_session(api_key: str, pool_size: int = DEFAULT_POOL_SIZE, http2: bool = False) -> Session:
+    """Create an HTTP session with a keep-alive connection pool for one node"""
+    headers = {
+        "X-API-Key": api_key,
+        "Content-Type": "application/json",
+        "Accept": ACCEPT_HEADER
+    }
+    if http2:
+        try:
+            return HTTP2Session(headers, pool_size, min(pool_size, POOL_SIZE_PER_HOST), DEFAULT_TIMEOUT)
+        except ImportError as e:
+            logger.warning("HTTP/2 unavailable, falling back to HTTP/1.1: %s", e)
+            
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=min(pool_size, POOL_SIZE_PER_HOST),
+        ttl_dns_cache=300,
+        keepalive_timeout=75
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=headers,
+        json_serialize=json_dumps,
+        timeout=DEFAULT_TIMEOUT
+    )
+
+
+def get_shared_session(node_url: str, api_key: str, http2: bool = False) -> Session:
+    """
+    Get the process-wide HTTP session for a node and API key.
+
+    Every InterverseChain created with share_session=True for the same node
+    and key uses this session, so they all draw from one warm connection
+    pool. A new session is created if the previous one was closed or belongs
+    to another event loop. Must be called from within a running event loop.
+    """
+    key = (node_url.rstrip('/'), api_key, http2)
+    loop = asyncio.get_running_loop()
+    entry = _shared_sessions.get(key)
+    if entry is not None:
+        session, session_loop = entry
+        if not session.closed and session_loop is loop:
+            return session
+    pool_size = int(os.environ.get("RPC_POOL_SIZE", DEFAULT_POOL_SIZE))
+    session = _create_session(api_key, pool_size, http2)
+    _shared_sessions[key] = (session, loop)
+    return session
+
+
+async def close_shared_sessions() -> None:
+    """Close every shared session (e.g. on application shutdown)"""
+    entries = list(_shared_sessions.values())
+    _shared_sessions.clear()
+    for session, _ in entries:
+        if not session.closed:
+            await session.close()
+
+# Maximum number of event handlers running at the same time
+MAX_CONCURRENT_HANDLERS = 64
+
+# Balance pushes for one address arriving within this window (seconds) are
+# delivered to handlers once, with the latest balance
+BALANCE_EVENT_WINDOW = 0.05
+
+# Threads running plain event handlers registered with threaded=True
+HANDLER_POOL_SIZE = 8
+
+# Mints and transfers are sent in batches of up to this many items, waiting
+# at most this long for a batch to fill while earlier batches are in flight
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_WAIT_MS = 25
+
 class InterverseChain:
     """Core blockchain connectivity and operations"""
     
     def __init__(self, node_url: str = "https://verse-coin-7b67e4d49b53.herokuapp.com", 
-                game_id: str = "", api_key: str = ""):
+                game_id: str = "", api_key: str = "", share_session: bool = False, 
+                http2: bool = False):
         self.node_url = node_url.rstrip('/')  # Remove trailing slash if present
         self.game_id = game_id
         self.api_key = api_key
         self.websocket = None
         self.http_session = None
+        self.share_session = share_session  # Use the process-wide session for this node
+        self._owns_session = False  # Only close the session if this instance created it
+        self.http2 = http2  # Multiplex requests over one HTTP/2 connection (requires httpx)
+        self.pool_size = int(os.environ.get("RPC_POOL_SIZE", DEFAULT_POOL_SIZE))
         self.is_connected = False
         self.event_handlers = {
             "asset_minted": [],
@@ -27,187 +142,215 @@ class InterverseChain:
             "websocket_message": [],
             "error": []
         }
+        self._inflight: Dict[tuple, asyncio.Future] = {}  # Read requests currently on the wire
+        self._inline_handlers: Set[Callable] = set()  # Handlers called synchronously on dispatch
+        self._threaded_handlers: Set[Callable] = set()  # Plain handlers run in the handler thread pool
+        self._handler_tasks: Set[asyncio.Task] = set()  # Keeps running handler tasks referenced
+        self._handler_slots: Optional[asyncio.Semaphore] = None  # Created on first dispatch
+        self._handler_pool: Optional[ThreadPoolExecutor] = None  # Runs sync handlers, created on first use
+        self._mint_batcher = AsyncBatcher(self._flush_mints, WRITE_BATCH_SIZE, WRITE_BATCH_WAIT_MS)
+        self._transfer_batcher = AsyncBatcher(self._flush_transfers, WRITE_BATCH_SIZE, WRITE_BATCH_WAIT_MS)
+        self._batch_routes: Dict[str, bool] = {}  # Batch endpoints known to be missing on the node
+        self._asset_cache = TTLCache(maxsize=4096, ttl=ASSET_CACHE_TTL)  # asset_id -> (etag, asset)
+        self._game_info: Optional[Tuple[float, Dict[str, Any]]] = None  # (expiry, verify_game result)
+        self._asset_patch_supported = True  # Cleared when the node rejects PATCH /assets/{id}
         self.reconnect_attempts = 0
-        self.max_reconnect_attempts = 5
+        self.max_reconnect_attempts: Optional[int] = None  # None retries until close()
         self.reconnect_delay = 5  # Initial delay in seconds
+        self.max_backoff = 60  # Upper bound for the delay between attempts
+        self._ws_url = self._build_ws_url()  # Reused by every (re)connect
+        self._pending_balances: Dict[str, Any] = {}  # address -> latest pushed balance not yet delivered
+        self._balance_timers: Dict[str, asyncio.TimerHandle] = {}  # address -> scheduled _flush_balance
+        self._ws_dispatch: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "welcome": self._on_ws_welcome,
+            "asset_update": self._on_ws_asset,
+            "new_asset": self._on_ws_asset,
+            "balance_update": self._on_ws_balance,
+            "transfer_complete": self._on_ws_transfer
+        }
+        self._closed = False
+        self._warmup_task: Optional[asyncio.Future] = None  # Pre-opens a pooled connection
+        self._timeout_streak = 0  # Consecutive request timeouts
+        self._backoff_until = 0.0  # Loop time before which new requests wait
     
     async def initialize(self) -> bool:
-        """Initialize the SDK and establish HTTP session"""
+        """Initialize the SDK and establish the pooled HTTP session"""
         try:
-            if self.http_session is None or self.http_session.closed:
-                self.http_session = aiohttp.ClientSession(
-                    headers={"X-API-Key": self.api_key, "Content-Type": "application/json"}
-                )
+            if not self._session_is_healthy():
+                # Replace a stale session instead of reusing its broken pool
+                if self._owns_session and self.http_session is not None and not self.http_session.closed:
+                    await self.http_session.close()
+                    
+                if self.share_session:
+                    self.http_session = get_shared_session(self.node_url, self.api_key, self.http2)
+                    self._owns_session = False
+                else:
+                    self.http_session = _create_session(self.api_key, self.pool_size, self.http2)
+                    self._owns_session = True
+                    
+                # Open a connection now so the first real call doesn't pay for the handshake
+                self._warmup_task = asyncio.ensure_future(self._warmup())
             return True
         except Exception as e:
-            logger.error(f"Failed to initialize HTTP session: {e}")
+            logger.error("Failed to initialize HTTP session: %s", e)
             self._trigger_event("error", {"message": f"Initialization failed: {e}"})
             return False
         
     async def connect(self) -> bool:
         """Connect to the Interverse blockchain network via WebSocket"""
+        self._closed = False
+        return await self._connect()
+    
+    async def _connect(self) -> bool:
+        """Open the WebSocket and start handling messages"""
         if not await self.initialize():
             return False
             
         try:
             # Close existing connection if any
-            await self.disconnect()
+            await self._close_websocket()
             
             # Connect WebSocket for real-time updates
-            ws_url = f"{self.node_url.replace('http', 'ws')}/ws?api_key={self.api_key}"
-            logger.info(f"Connecting to WebSocket: {ws_url}")
+            logger.info("Connecting to WebSocket: %s", self._ws_url.split('?', 1)[0])
             
+            # Event frames are small and mostly random ids/hex, so
+            # permessage-deflate costs CPU without saving much bandwidth
             self.websocket = await websockets.connect(
-                ws_url,
-                extra_headers={"X-API-Key": self.api_key}
+                self._ws_url,
+                compression=None,
+                max_size=2 ** 20,
+                ping_interval=20,
+                ping_timeout=20,
+                close_timeout=5,
+                **{_WS_HEADERS_ARG: {"X-API-Key": self.api_key}}
             )
             
             # Send handshake message
-            handshake_msg = json.dumps({
+            handshake = {
                 "type": "handshake",
                 "game_id": self.game_id
-            })
+            }
+            if msgpack is not None:
+                # Ask for binary msgpack frames; JSON text frames are still accepted
+                handshake["encoding"] = "msgpack"
+            handshake_msg = json_dumps(handshake)
             await self.websocket.send(handshake_msg)
-            logger.debug(f"Sent handshake: {handshake_msg}")
+            logger.debug("Sent handshake: %s", handshake_msg)
             
             # Start message handling
             asyncio.create_task(self._handle_messages())
             
+            # reconnect_attempts is reset once the node welcomes us
             self.is_connected = True
-            self.reconnect_attempts = 0
             
             # Trigger connected event
             self._trigger_event("websocket_connected", {"success": True})
             return True
             
         except Exception as e:
-            logger.error(f"WebSocket connection error: {e}")
+            logger.error("WebSocket connection error: %s", e)
             self._trigger_event("websocket_connected", {"success": False, "error": str(e)})
             self._trigger_event("error", {"message": f"Connection failed: {e}"})
             return False
     
+    def _build_ws_url(self) -> str:
+        """Derive the WebSocket endpoint (ws:// or wss://) from the node URL"""
+        parts = urlsplit(self.node_url)
+        scheme = {"http": "ws", "https": "wss"}.get(parts.scheme, parts.scheme)
+        query = urlencode({"api_key": self.api_key})
+        return urlunsplit((scheme, parts.netloc, f"{parts.path}/ws", query, ""))
+    
     async def disconnect(self) -> None:
         """Disconnect from the WebSocket"""
-        if self.websocket is not None:
+        self._closed = True  # Stops any pending reconnect
+        await self._close_websocket()
+    
+    async def _close_websocket(self) -> None:
+        """Close the current WebSocket, if any"""
+        websocket = self.websocket
+        if websocket is not None:
+            self.websocket = None
+            self.is_connected = False
             try:
-                await self.websocket.close()
+                await websocket.close()
                 logger.info("WebSocket disconnected")
             except Exception as e:
-                logger.error(f"Error during WebSocket disconnect: {e}")
-            finally:
-                self.websocket = None
-                self.is_connected = False
+                logger.error("Error during WebSocket disconnect: %s", e)
     
     async def create_wallet(self) -> Dict[str, Any]:
         """Create a new blockchain wallet"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
+        result = await self._request("POST", "/wallet/create", "Wallet creation")
+        if not result["success"]:
+            return result
             
-        try:
-            async with self.http_session.post(
-                f"{self.node_url}/wallet/create"
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Wallet creation failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                if data.get("success", False):
-                    wallet_data = data.get("data", {})
-                    logger.info(f"Wallet created: {wallet_data.get('address', 'unknown')}")
-                    return {"success": True, "wallet": wallet_data}
-                else:
-                    logger.error(f"Wallet creation failed: {data.get('message', 'Unknown error')}")
-                    return {"success": False, "error": data.get("message", "Unknown error")}
-                    
-        except Exception as e:
-            logger.error(f"Wallet creation error: {e}")
-            self._trigger_event("error", {"message": f"Wallet creation failed: {e}"})
-            return {"success": False, "error": str(e)}
+        wallet_data = result["data"]
+        logger.info("Wallet created: %s", wallet_data.get('address', 'unknown'))
+        return {"success": True, "wallet": wallet_data}
     
     async def get_balance(self, address: str) -> Dict[str, Any]:
         """Get wallet balance"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
-            
         if not address or not isinstance(address, str):
             return {"success": False, "error": "Invalid address"}
-            
-        try:
-            async with self.http_session.get(
-                f"{self.node_url}/wallet/{address}/balance"
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Balance check failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                if data.get("success", False):
-                    balance_data = data.get("data", {})
-                    balance = balance_data.get("balance", 0.0)
-                    logger.debug(f"Balance for {address}: {balance}")
-                    
-                    self._trigger_event("balance_updated", {
-                        "address": address,
-                        "balance": balance
-                    })
-                    
-                    return {
-                        "success": True,
-                        "address": address,
-                        "balance": balance
-                    }
-                else:
-                    logger.error(f"Balance check failed: {data.get('message', 'Unknown error')}")
-                    return {"success": False, "error": data.get("message", "Unknown error")}
-                    
-        except Exception as e:
-            logger.error(f"Balance check error: {e}")
-            self._trigger_event("error", {"message": f"Balance check failed: {e}"})
-            return {"success": False, "error": str(e)}
+        return await self._coalesce(("get_balance", address), lambda: self._get_balance(address))
     
-    async def get_player_assets(self, address: str) -> Dict[str, Any]:
-        """Get assets owned by a player"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
+    async def _get_balance(self, address: str) -> Dict[str, Any]:
+        """Get wallet balance (uncoalesced request)"""
+        result = await self._request("GET", f"/wallet/{address}/balance", "Balance check")
+        if not result["success"]:
+            return result
             
+        balance = result["data"].get("balance", 0.0)
+        logger.debug("Balance for %s: %s", address, balance)
+        
+        self._trigger_event("balance_updated", {
+            "address": address,
+            "balance": balance
+        })
+        
+        return {
+            "success": True,
+            "address": address,
+            "balance": balance
+        }
+    
+    async def get_player_assets(
+        self, 
+        address: str, 
+        offset: Optional[int] = None, 
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get assets owned by a player, optionally one page (offset/limit) at a time"""
         if not address or not isinstance(address, str):
             return {"success": False, "error": "Invalid address"}
+        return await self._coalesce(
+            ("get_player_assets", address, offset, limit),
+            lambda: self._get_player_assets(address, offset, limit)
+        )
+    
+    async def _get_player_assets(
+        self, 
+        address: str, 
+        offset: Optional[int] = None, 
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get assets owned by a player (uncoalesced request)"""
+        result = await self._request(
+            "GET", f"/wallet/{address}/assets", "Asset fetch",
+            params=self._page_params(offset, limit)
+        )
+        if not result["success"]:
+            return result
             
-        try:
-            async with self.http_session.get(
-                f"{self.node_url}/wallet/{address}/assets"
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Asset fetch failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                if data.get("success", False):
-                    assets = data.get("data", {}).get("assets", [])
-                    logger.debug(f"Retrieved {len(assets)} assets for {address}")
-                    return {
-                        "success": True,
-                        "address": address,
-                        "assets": assets
-                    }
-                else:
-                    logger.error(f"Asset fetch failed: {data.get('message', 'Unknown error')}")
-                    return {"success": False, "error": data.get("message", "Unknown error")}
-                    
-        except Exception as e:
-            logger.error(f"Asset fetch error: {e}")
-            self._trigger_event("error", {"message": f"Asset fetch failed: {e}"})
-            return {"success": False, "error": str(e)}
+        assets = result["data"].get("assets", [])
+        logger.debug("Retrieved %d assets for %s", len(assets), address)
+        return {
+            "success": True,
+            "address": address,
+            "assets": assets
+        }
     
     async def mint_asset(self, owner_address: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Mint a new game asset on the blockchain"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
-            
         if not owner_address or not isinstance(owner_address, str):
             return {"success": False, "error": "Invalid owner address"}
             
@@ -229,46 +372,34 @@ class InterverseChain:
             # Add metadata
             payload["metadata"] = properties
             
-            logger.debug(f"Minting asset payload: {json.dumps(payload)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Minting asset payload: %s", json_dumps(payload))
             
-            async with self.http_session.post(
-                f"{self.node_url}/assets/mint",
-                json=payload
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Asset minting failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                if data.get("success", False):
-                    asset_data = data.get("data", {})
-                    asset_id = asset_data.get("asset_id", "")
-                    logger.info(f"Asset minted: {asset_id} for {owner_address}")
-                    
-                    self._trigger_event("asset_minted", {
-                        "asset": asset_data,
-                        "owner": owner_address
-                    })
-                    
-                    return {
-                        "success": True,
-                        "asset": asset_data
-                    }
-                else:
-                    logger.error(f"Asset minting failed: {data.get('message', 'Unknown error')}")
-                    return {"success": False, "error": data.get("message", "Unknown error")}
-                    
+            # Concurrent mints share one request to the node
+            result = await self._mint_batcher.add(payload)
+            if not result["success"]:
+                return result
+                
+            asset_data = result["data"]
+            logger.info("Asset minted: %s for %s", asset_data.get('asset_id', ''), owner_address)
+            
+            self._trigger_event("asset_minted", {
+                "asset": asset_data,
+                "owner": owner_address
+            })
+            
+            return {
+                "success": True,
+                "asset": asset_data
+            }
+                
         except Exception as e:
-            logger.error(f"Asset minting error: {e}")
+            logger.error("Asset minting error: %s", e)
             self._trigger_event("error", {"message": f"Asset minting failed: {e}"})
             return {"success": False, "error": str(e)}
     
     async def transfer_asset(self, asset_id: str, from_address: str, to_address: str) -> Dict[str, Any]:
         """Transfer an asset between addresses"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
-            
         if not asset_id or not from_address or not to_address:
             return {"success": False, "error": "Missing required parameters"}
             
@@ -279,264 +410,447 @@ class InterverseChain:
                 "to_address": to_address
             }
             
-            logger.debug(f"Transferring asset: {asset_id} from {from_address} to {to_address}")
+            logger.debug("Transferring asset: %s from %s to %s", asset_id, from_address, to_address)
             
-            async with self.http_session.post(
-                f"{self.node_url}/assets/transfer",
-                json=payload
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Asset transfer failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                transfer_success = data.get("success", False)
+            # Concurrent transfers share one request to the node
+            result = await self._transfer_batcher.add(payload)
+            if not result["success"]:
+                self._trigger_event("transfer_complete", {
+                    "asset_id": asset_id,
+                    "from_address": from_address,
+                    "to_address": to_address,
+                    "success": False,
+                    "error": result["error"]
+                })
+                return result
+                
+            self._asset_cache.pop(asset_id)  # Owner changed
+            logger.info("Asset transferred: %s to %s", asset_id, to_address)
+            
+            self._trigger_event("transfer_complete", {
+                "asset_id": asset_id,
+                "from_address": from_address,
+                "to_address": to_address,
+                "success": True
+            })
+            
+            return {
+                "success": True,
+                "asset_id": asset_id,
+                "transaction_id": result["data"].get("transaction_id", ""),
+                "from_address": from_address,
+                "to_address": to_address
+            }
                 
-                if transfer_success:
-                    transfer_data = data.get("data", {})
-                    logger.info(f"Asset transferred: {asset_id} to {to_address}")
-                    
-                    self._trigger_event("transfer_complete", {
-                        "asset_id": asset_id,
-                        "from_address": from_address,
-                        "to_address": to_address,
-                        "success": True
-                    })
-                    
-                    return {
-                        "success": True,
-                        "asset_id": asset_id,
-                        "transaction_id": transfer_data.get("transaction_id", ""),
-                        "from_address": from_address,
-                        "to_address": to_address
-                    }
-                else:
-                    error_msg = data.get("message", "Unknown error")
-                    logger.error(f"Asset transfer failed: {error_msg}")
-                    
-                    self._trigger_event("transfer_complete", {
-                        "asset_id": asset_id,
-                        "from_address": from_address,
-                        "to_address": to_address,
-                        "success": False,
-                        "error": error_msg
-                    })
-                    
-                    return {"success": False, "error": error_msg}
-                    
         except Exception as e:
-            logger.error(f"Asset transfer error: {e}")
+            logger.error("Asset transfer error: %s", e)
             self._trigger_event("error", {"message": f"Asset transfer failed: {e}"})
             return {"success": False, "error": str(e)}
     
+    async def _flush_mints(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send a batch of mint payloads, returning the result for each"""
+        return await self._post_batch("/assets/mint", "Asset minting", payloads)
+    
+    async def _flush_transfers(self, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send a batch of transfer payloads, returning the result for each"""
+        return await self._post_batch("/assets/transfer", "Asset transfer", payloads)
+    
+    async def _post_batch(self, route: str, action: str, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        POST several payloads to ``{route}_batch`` as one JSON array.
+        
+        The node answers with ``{"success": true, "data": [...]}``, holding
+        one response envelope per payload in order. Nodes without the batch
+        route (404/405) get the payloads as concurrent single requests to
+        ``route`` instead. Returns one _request-style result per payload.
+        """
+        if len(payloads) > 1 and self._batch_routes.get(route, True):
+            result = await self._request(
+                "POST", f"{route}_batch", action,
+                json=payloads, passthrough=(404, 405), timeout=WRITE_TIMEOUT
+            )
+            if result.get("status") in (404, 405):
+                logger.info("Node has no %s_batch route, sending requests individually", route)
+                self._batch_routes[route] = False
+            elif not result["success"]:
+                # One dict per payload, so a caller modifying its result doesn't affect the others
+                return [dict(result) for _ in payloads]
+            else:
+                responses = result["data"]
+                if not isinstance(responses, list) or len(responses) != len(payloads):
+                    logger.error("%s failed: invalid batch response", action)
+                    return [{"success": False, "error": "Invalid batch response"} for _ in payloads]
+                return [self._unwrap(response, action) for response in responses]
+                
+        return list(await asyncio.gather(*(
+            self._request("POST", route, action, json=payload, timeout=WRITE_TIMEOUT) for payload in payloads
+        )))
+    
     async def get_asset(self, asset_id: str) -> Dict[str, Any]:
-        """Get details of a specific asset"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
-            
+        """
+        Get details of a specific asset (cached for ASSET_CACHE_TTL seconds).
+        
+        Every call gets its own copy of the asset dict; nested values such as
+        metadata are shared with the cache and must not be modified.
+        """
         if not asset_id or not isinstance(asset_id, str):
             return {"success": False, "error": "Invalid asset ID"}
             
-        try:
-            async with self.http_session.get(
-                f"{self.node_url}/assets/{asset_id}"
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Asset fetch failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                if data.get("success", False):
-                    asset_data = data.get("data", {})
-                    logger.debug(f"Retrieved asset: {asset_id}")
-                    return {
-                        "success": True,
-                        "asset": asset_data
-                    }
-                else:
-                    logger.error(f"Asset fetch failed: {data.get('message', 'Unknown error')}")
-                    return {"success": False, "error": data.get("message", "Unknown error")}
-                    
-        except Exception as e:
-            logger.error(f"Asset fetch error: {e}")
-            self._trigger_event("error", {"message": f"Asset fetch failed: {e}"})
-            return {"success": False, "error": str(e)}
+        cached = self._asset_cache.get(asset_id)
+        if cached is None:
+            result = await self._coalesce(("get_asset", asset_id), lambda: self._get_asset(asset_id))
+            if not result["success"]:
+                return result
+            asset = result["asset"]
+        else:
+            asset = cached[1]
+        return {"success": True, "asset": dict(asset)}
     
-    async def get_transaction_history(self, address: str) -> Dict[str, Any]:
-        """Get transaction history for an address"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
+    async def _get_asset(self, asset_id: str) -> Dict[str, Any]:
+        """Get details of a specific asset (uncoalesced request)"""
+        result = await self._request("GET", f"/assets/{asset_id}", "Asset fetch")
+        if not result["success"]:
+            return result
             
+        asset_data = result["data"]
+        logger.debug("Retrieved asset: %s", asset_id)
+        self._asset_cache[asset_id] = (result["headers"].get("ETag"), asset_data)
+        return {
+            "success": True,
+            "asset": asset_data
+        }
+    
+    async def get_transaction_history(
+        self, 
+        address: str, 
+        offset: Optional[int] = None, 
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get transaction history for an address, optionally one page (offset/limit) at a time"""
         if not address or not isinstance(address, str):
             return {"success": False, "error": "Invalid address"}
+        return await self._coalesce(
+            ("get_transaction_history", address, offset, limit),
+            lambda: self._get_transaction_history(address, offset, limit)
+        )
+    
+    async def _get_transaction_history(
+        self, 
+        address: str, 
+        offset: Optional[int] = None, 
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get transaction history for an address (uncoalesced request)"""
+        result = await self._request(
+            "GET", f"/transactions/{address}", "Transaction history",
+            params=self._page_params(offset, limit)
+        )
+        if not result["success"]:
+            return result
             
-        try:
-            async with self.http_session.get(
-                f"{self.node_url}/transactions/{address}"
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Transaction history failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                if data.get("success", False):
-                    tx_data = data.get("data", {})
-                    transactions = tx_data.get("transactions", [])
-                    logger.debug(f"Retrieved {len(transactions)} transactions for {address}")
-                    return {
-                        "success": True,
-                        "address": address,
-                        "transactions": transactions
-                    }
-                else:
-                    logger.error(f"Transaction history failed: {data.get('message', 'Unknown error')}")
-                    return {"success": False, "error": data.get("message", "Unknown error")}
-                    
-        except Exception as e:
-            logger.error(f"Transaction history error: {e}")
-            self._trigger_event("error", {"message": f"Transaction history failed: {e}"})
-            return {"success": False, "error": str(e)}
+        transactions = result["data"].get("transactions", [])
+        logger.debug("Retrieved %d transactions for %s", len(transactions), address)
+        return {
+            "success": True,
+            "address": address,
+            "transactions": transactions
+        }
     
     async def verify_game(self) -> Dict[str, Any]:
-        """Verify game registration with the blockchain"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
+        """Verify game registration with the blockchain (cached for GAME_INFO_TTL seconds)"""
+        game_info = self._game_info
+        if game_info is not None and game_info[0] > time.monotonic():
+            return dict(game_info[1])
             
-        try:
-            async with self.http_session.get(
-                f"{self.node_url}/games/verify"
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Game verification failed: HTTP {response.status} - {error_text}")
-                    return {"success": False, "error": f"HTTP {response.status}: {error_text}"}
-                    
-                data = await response.json()
-                if data.get("success", False):
-                    game_data = data.get("data", {})
-                    logger.info(f"Game verified: {game_data.get('game_id', 'unknown')}")
-                    return {
-                        "success": True,
-                        "game": game_data
-                    }
-                else:
-                    logger.error(f"Game verification failed: {data.get('message', 'Unknown error')}")
-                    return {"success": False, "error": data.get("message", "Unknown error")}
-                    
-        except Exception as e:
-            logger.error(f"Game verification error: {e}")
-            self._trigger_event("error", {"message": f"Game verification failed: {e}"})
-            return {"success": False, "error": str(e)}
+        result = await self._coalesce(("verify_game",), self._verify_game)
+        if result.get("success", False):
+            self._game_info = (time.monotonic() + GAME_INFO_TTL, dict(result))
+        return result
+    
+    async def _verify_game(self) -> Dict[str, Any]:
+        """Verify game registration with the blockchain (uncoalesced request)"""
+        result = await self._request("GET", "/games/verify", "Game verification")
+        if not result["success"]:
+            return result
+            
+        game_data = result["data"]
+        logger.info("Game verified: %s", game_data.get('game_id', 'unknown'))
+        return {
+            "success": True,
+            "game": game_data
+        }
     
     async def update_asset(self, asset_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing asset's properties"""
-        if not await self.ensure_initialized():
-            return {"success": False, "error": "Not initialized"}
-            
         if not asset_id or not isinstance(asset_id, str):
             return {"success": False, "error": "Invalid asset ID"}
             
         try:
-            # Get existing asset first
+            return await self._update_asset(asset_id, properties, retry=True)
+        except Exception as e:
+            logger.error("Asset update error: %s", e)
+            self._trigger_event("error", {"message": f"Asset update failed: {e}"})
+            return {"success": False, "error": str(e)}
+    
+    async def _update_asset(self, asset_id: str, properties: Dict[str, Any], retry: bool) -> Dict[str, Any]:
+        """Send only the changed metadata keys, reusing the last fetched asset if still fresh"""
+        state = self._asset_cache.get(asset_id)
+        if state is None:
             asset_result = await self.get_asset(asset_id)
             if not asset_result.get("success", False):
                 return asset_result
-                
-            existing_asset = asset_result.get("asset", {})
+            state = self._asset_cache.get(asset_id) or (None, asset_result.get("asset", {}))
+            
+        etag, existing_asset = state
+        metadata = existing_asset.get("metadata") or {}
+        changes = {key: value for key, value in properties.items()
+                   if key not in metadata or metadata[key] != value}
+        if not changes:
+            return {"success": True, "asset": existing_asset}
             
-            # Update metadata with new properties
-            metadata = existing_asset.get("metadata", {})
-            for key, value in properties.items():
-                metadata[key] = value
+        if self._asset_patch_supported:
+            result = await self._request(
+                "PATCH", f"/assets/{asset_id}", "Asset update",
+                json={"asset_id": asset_id, "metadata": changes},
+                headers={"If-Match": etag} if etag else None,
+                passthrough=(404, 405, 412),
+                timeout=WRITE_TIMEOUT
+            )
+            status = result.get("status")
+            if status == 412 and retry:
+                # Someone else changed the asset since we fetched it
+                self._asset_cache.pop(asset_id)
+                return await self._update_asset(asset_id, properties, retry=False)
+            if status in (404, 405):
+                logger.info("Node does not support PATCH /assets/{id}, using PUT")
+                self._asset_patch_supported = False
+            else:
+                return self._finish_update(asset_id, result, existing_asset, changes)
                 
-            # Prepare update payload
-            payload = {
-                "asset_id": asset_id,
-                "metadata": metadata
-            }
+        # Older nodes only accept the full metadata
+        result = await self._request(
+            "PUT", f"/assets/{asset_id}", "Asset update",
+            json={"asset_id": asset_id, "metadata": {**metadata, **changes}},
+            passthrough=(404, 405),
+            timeout=WRITE_TIMEOUT
+        )
+        if result.get("status") not in (404, 405):
+            return self._finish_update(asset_id, result, existing_asset, changes)
             
-            # Check if backend supports asset updates
-            try:
-                async with self.http_session.put(
-                    f"{self.node_url}/assets/{asset_id}",
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get("success", False):
-                            updated_asset = data.get("data", {})
-                            logger.info(f"Asset updated: {asset_id}")
-                            return {
-                                "success": True,
-                                "asset": updated_asset
-                            }
-                    # If HTTP 404 or other error, backend might not support direct updates
-            except:
-                pass
+        # Fallback to transfer workaround if no update endpoint is available
+        # This simulates an update by transferring to self
+        owner_address = existing_asset.get("owner", "")
+        if not owner_address:
+            return {"success": False, "error": "Cannot determine asset owner"}
+            
+        return await self.transfer_asset(asset_id, owner_address, owner_address)
+    
+    def _finish_update(
+        self, 
+        asset_id: str, 
+        result: Dict[str, Any], 
+        existing_asset: Dict[str, Any], 
+        changes: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Turn an update result into the public envelope and refresh the cached asset"""
+        if not result["success"]:
+            self._asset_cache.pop(asset_id)
+            return result
+            
+        updated_asset = result["data"] or {
+            **existing_asset, 
+            "metadata": {**(existing_asset.get("metadata") or {}), **changes}
+        }
+        self._asset_cache[asset_id] = (result["headers"].get("ETag"), updated_asset)
+        logger.info("Asset updated: %s", asset_id)
+        return {
+            "success": True,
+            "asset": updated_asset
+        }
+    
+    def invalidate_asset(self, asset_id: str) -> None:
+        """Drop the cached copy of an asset, e.g. after it was changed through another route"""
+        self._asset_cache.pop(asset_id)
+    
+    async def register_material_style(self, style: Dict[str, Any]) -> Dict[str, Any]:
+        """Register a material style (as produced by MaterialStyle.to_dict) on the node"""
+        return await self._request(
+            "POST", "/verse/material_styles/register", "Style registration",
+            json=style, timeout=WRITE_TIMEOUT
+        )
+    
+    async def register_material_styles(self, styles: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Register several material styles on the node in one request.
+        
+        Returns None if the node has no batch registration endpoint, so the
+        caller can register the styles one by one instead.
+        """
+        result = await self._request(
+            "POST", "/verse/material_styles/register_batch", "Style registration",
+            json=styles, passthrough=(404, 405), timeout=WRITE_TIMEOUT
+        )
+        if result.get("status") in (404, 405):
+            return None
+        return result
+    
+    async def apply_material_style(
+        self, 
+        asset_id: str, 
+        style_id: str, 
+        patch: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Have the node merge a material style into an asset in one request.
+        
+        Returns None if the node has no apply_style endpoint, so the caller
+        can fall back to get_asset/update_asset. A 404 for an unknown asset
+        is returned as an error instead.
+        """
+        if not asset_id or not isinstance(asset_id, str):
+            return {"success": False, "error": "Invalid asset ID"}
+            
+        result = await self._request(
+            "POST", f"/verse/assets/{asset_id}/apply_style", "Style application",
+            json={"style_id": style_id, "patch": patch},
+            passthrough=(404, 405),
+            timeout=WRITE_TIMEOUT
+        )
+        if self._route_missing(result):
+            return None
+        if result.get("status") == 404:
+            logger.error("Style application failed: %s", result["error"])
+            
+        # The node changed the asset, so drop any cached copy
+        self.invalidate_asset(asset_id)
+        if not result["success"]:
+            return result
+        return {"success": True, "asset": result["data"]}
+    
+    @staticmethod
+    def _route_missing(result: Dict[str, Any]) -> bool:
+        """Whether a passed-through 404/405 means the node lacks the route, not the resource"""
+        status = result.get("status")
+        if status != 404:
+            return status == 405
+        # Existing routes answer a missing resource with the node's JSON envelope;
+        # an unknown route gets the web framework's plain 404 page
+        body = result.get("error", "").partition(": ")[2]
+        try:
+            envelope = json_loads(body)
+        except json.JSONDecodeError:
+            return True
+        return not (isinstance(envelope, dict) and "success" in envelope)
+    
+    async def _request(
+        self, 
+        method: str, 
+        path: str, 
+        action: str, 
+        *, 
+        json: Any = None, 
+        params: Optional[Dict[str, Any]] = None, 
+        headers: Optional[Dict[str, str]] = None, 
+        passthrough: Tuple[int, ...] = (),
+        timeout: Optional[aiohttp.ClientTimeout] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a request to the node and unwrap its response envelope.
+        
+        Returns ``{"success": True, "data": ..., "status": ..., "headers": ...}``
+        when the node reports success, otherwise ``{"success": False,
+        "error": ..., "status": ...}`` (status is None if no response was
+        received). Failures are logged as "<action> failed"; exceptions also
+        trigger the error event. HTTP statuses listed in passthrough are
+        returned without logging, for callers that handle them.
+        
+        Requests use the session timeout (DEFAULT_TIMEOUT) unless a timeout
+        is given. A timed out request returns ``{"success": False, "error":
+        "timeout"}``, and while timeouts keep happening, new requests wait
+        out an exponentially growing backoff instead of piling onto the node.
+        """
+        if not await self.ensure_initialized():
+            return {"success": False, "error": "Not initialized", "status": None}
+            
+        loop = asyncio.get_running_loop()
+        if self._timeout_streak:
+            delay = self._backoff_until - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
                 
-            # Fallback to transfer workaround if update endpoint not available
-            # This simulates an update by transferring to self
-            owner_address = existing_asset.get("owner", "")
-            if not owner_address:
-                return {"success": False, "error": "Cannot determine asset owner"}
+        try:
+            async with self.http_session.request(
+                method,
+                f"{self.node_url}{path}",
+                json=json,
+                params=params,
+                headers=headers,
+                timeout=timeout or self.http_session.timeout
+            ) as response:
+                self._timeout_streak = 0
+                status = response.status
+                if status != 200:
+                    error_text = await response.text()
+                    if status not in passthrough:
+                        logger.error("%s failed: HTTP %s - %s", action, status, error_text)
+                    return {"success": False, "error": f"HTTP {status}: {error_text}", "status": status}
+                    
+                result = self._unwrap(await self._read_body(response), action)
+                result["status"] = status
+                if result["success"]:
+                    result["headers"] = response.headers
+                return result
                 
-            return await self.transfer_asset(asset_id, owner_address, owner_address)
+        except asyncio.TimeoutError:
+            self._timeout_streak += 1
+            backoff = min(self.max_backoff, TIMEOUT_BACKOFF * (2 ** (self._timeout_streak - 1)))
+            self._backoff_until = loop.time() + random.uniform(0.5 * backoff, 1.5 * backoff)
+            logger.warning("%s timed out (%d in a row)", action, self._timeout_streak)
+            self._trigger_event("error", {"message": f"{action} failed: timeout"})
+            return {"success": False, "error": "timeout", "status": None}
             
         except Exception as e:
-            logger.error(f"Asset update error: {e}")
-            self._trigger_event("error", {"message": f"Asset update failed: {e}"})
-            return {"success": False, "error": str(e)}
+            logger.error("%s error: %s", action, e)
+            self._trigger_event("error", {"message": f"{action} failed: {e}"})
+            return {"success": False, "error": str(e), "status": None}
+    
+    @staticmethod
+    def _unwrap(body: Dict[str, Any], action: str) -> Dict[str, Any]:
+        """Convert a node response body into a success/data or error result"""
+        if body.get("success", False):
+            return {"success": True, "data": body.get("data", {})}
+        message = body.get("message", "Unknown error")
+        logger.error("%s failed: %s", action, message)
+        return {"success": False, "error": message}
     
     async def _handle_messages(self):
         """Handle incoming WebSocket messages"""
         if self.websocket is None:
             return
             
+        # Bound once for the whole stream
+        dispatch = self._ws_dispatch
+        trigger = self._trigger_event
+        raw_handlers = self.event_handlers["websocket_message"]
+        
         try:
             async for message in self.websocket:
                 try:
-                    data = json.loads(message)
-                    logger.debug(f"WebSocket message received: {message[:100]}...")
+                    # Binary frames carry msgpack, text frames JSON
+                    data = msgpack_loads(message) if isinstance(message, bytes) else json_loads(message)
+                    logger.debug("WebSocket message received: %.100s...", message)
                     
                     # Broadcast raw message event
-                    self._trigger_event("websocket_message", {"raw": message, "data": data})
-                    
-                    # Handle specific message types
-                    message_type = data.get("type")
-                    if message_type == "welcome":
-                        logger.info(f"Welcome message received for game: {data.get('game_id', 'unknown')}")
-                        
-                    elif message_type == "asset_update" or message_type == "new_asset":
-                        asset_data = data.get("asset", {})
-                        owner = asset_data.get("owner", "")
-                        self._trigger_event("asset_minted", {
-                            "asset": asset_data,
-                            "owner": owner
-                        })
-                        
-                    elif message_type == "balance_update":
-                        balance_data = data.get("data", {})
-                        address = balance_data.get("address", "")
-                        balance = balance_data.get("balance", 0.0)
-                        self._trigger_event("balance_updated", {
-                            "address": address,
-                            "balance": balance
-                        })
+                    if raw_handlers:
+                        trigger("websocket_message", {"raw": message, "data": data})
                         
-                    elif message_type == "transfer_complete":
-                        transfer_data = data.get("data", {})
-                        self._trigger_event("transfer_complete", {
-                            "asset_id": transfer_data.get("asset_id", ""),
-                            "from_address": transfer_data.get("sender", ""),
-                            "to_address": transfer_data.get("recipient", ""),
-                            "success": transfer_data.get("success", False)
-                        })
+                    # Handle specific message types
+                    handler = dispatch.get(data.get("type"))
+                    if handler is not None:
+                        handler(data)
                         
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in WebSocket message: {message[:100]}...")
+                except (ValueError, ImportError):
+                    logger.warning("Undecodable WebSocket message: %.100r...", message)
                     
         except websockets.exceptions.ConnectionClosed:
             logger.warning("WebSocket connection closed")
@@ -544,57 +858,241 @@ class InterverseChain:
             await self._attempt_reconnect()
             
         except Exception as e:
-            logger.error(f"Error in WebSocket message handler: {e}")
+            logger.error("Error in WebSocket message handler: %s", e)
             self._trigger_event("error", {"message": f"WebSocket handler error: {e}"})
             self.is_connected = False
             await self._attempt_reconnect()
     
+    def _on_ws_welcome(self, data: Dict[str, Any]) -> None:
+        """Handle the node's welcome message (handshake acknowledged)"""
+        self.reconnect_attempts = 0
+        logger.info("Welcome message received for game: %s", data.get('game_id', 'unknown'))
+    
+    def _on_ws_asset(self, data: Dict[str, Any]) -> None:
+        """Handle asset_update / new_asset pushes"""
+        asset_data = data.get("asset", {})
+        self._asset_cache.pop(asset_data.get("asset_id") or asset_data.get("id"))
+        self._trigger_event("asset_minted", {
+            "asset": asset_data,
+            "owner": asset_data.get("owner", "")
+        })
+    
+    def _on_ws_balance(self, data: Dict[str, Any]) -> None:
+        """Handle balance_update pushes, coalescing bursts for the same address"""
+        balance_data = data.get("data", {})
+        address = balance_data.get("address", "")
+        pending = self._pending_balances
+        first = address not in pending
+        pending[address] = balance_data.get("balance", 0.0)
+        if first:
+            self._balance_timers[address] = asyncio.get_running_loop().call_later(
+                BALANCE_EVENT_WINDOW, self._flush_balance, address
+            )
+    
+    def _flush_balance(self, address: str) -> None:
+        """Deliver the latest pushed balance of an address to handlers"""
+        self._balance_timers.pop(address, None)
+        if address in self._pending_balances:
+            self._trigger_event("balance_updated", {
+                "address": address,
+                "balance": self._pending_balances.pop(address)
+            })
+    
+    def _on_ws_transfer(self, data: Dict[str, Any]) -> None:
+        """Handle transfer_complete pushes"""
+        get = data.get("data", {}).get
+        self._trigger_event("transfer_complete", {
+            "asset_id": get("asset_id", ""),
+            "from_address": get("sender", ""),
+            "to_address": get("recipient", ""),
+            "success": get("success", False)
+        })
+    
     async def _attempt_reconnect(self):
-        """Attempt to reconnect to WebSocket with exponential backoff"""
-        if self.reconnect_attempts >= self.max_reconnect_attempts:
-            logger.error(f"Maximum reconnection attempts ({self.max_reconnect_attempts}) reached")
-            self._trigger_event("error", {"message": "Maximum reconnection attempts reached"})
-            return
+        """Attempt to reconnect to WebSocket with jittered exponential backoff"""
+        while self.max_reconnect_attempts is None or self.reconnect_attempts < self.max_reconnect_attempts:
+            self.reconnect_attempts += 1
+            backoff = min(self.max_backoff, self.reconnect_delay * (2 ** (self.reconnect_attempts - 1)))
+            # Spread clients out so they don't all reconnect at the same moment
+            delay = random.uniform(0.5 * backoff, 1.5 * backoff)
             
-        self.reconnect_attempts += 1
-        backoff = self.reconnect_delay * (2 ** (self.reconnect_attempts - 1))
+            logger.info("Attempting reconnect in %.1f seconds (attempt %d)", delay, self.reconnect_attempts)
+            await asyncio.sleep(delay)
+            if self._closed:
+                return
+            if await self._connect():
+                if self._closed:
+                    # disconnect() was called while we were connecting
+                    await self._close_websocket()
+                return
+                
+        logger.error("Maximum reconnection attempts (%s) reached", self.max_reconnect_attempts)
+        self._trigger_event("error", {"message": "Maximum reconnection attempts reached"})
+    
+    @staticmethod
+    def _page_params(offset: Optional[int], limit: Optional[int]) -> Optional[Dict[str, int]]:
+        """Build pagination query parameters, if any were requested"""
+        params = {}
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
+        return params or None
+    
+    async def _read_body(self, response: aiohttp.ClientResponse) -> Any:
+        """Decode a response body according to its content type (msgpack or JSON)"""
+        body = await response.read()
+        if response.content_type in MSGPACK_MEDIA_TYPES:
+            return msgpack_loads(body)
+        # Parse with orjson when available rather than aiohttp's stdlib json
+        return json_loads(body) if body else None
+    
+    async def _coalesce(self, key: tuple, request: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Share a single in-flight request between concurrent identical reads.
         
-        logger.info(f"Attempting reconnect in {backoff} seconds (attempt {self.reconnect_attempts})")
-        await asyncio.sleep(backoff)
-        await self.connect()
+        Each caller gets its own copy of the result dict. Nested values (asset
+        and transaction lists) are shared between the callers and must be
+        treated as read-only.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(request())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled doesn't cancel it for the others
+        return dict(await asyncio.shield(task))
+    
+    async def _warmup(self) -> None:
+        """Send a cheap request to establish a keep-alive connection to the node"""
+        try:
+            async with self.http_session.get(
+                f"{self.node_url}/health",
+                timeout=WARMUP_TIMEOUT
+            ) as response:
+                # Any status will do; reading the body returns the connection to the pool
+                await response.read()
+        except Exception as e:
+            logger.debug("Connection warmup failed: %s", e)
     
     async def ensure_initialized(self) -> bool:
         """Ensure HTTP session is initialized"""
-        if self.http_session is None or self.http_session.closed:
+        if not self._session_is_healthy():
             return await self.initialize()
         return True
     
-    def on(self, event_name: str, callback: Callable) -> None:
-        """Register event handler"""
+    def _session_is_healthy(self) -> bool:
+        """Check that the HTTP session and its connection pool are still usable"""
+        session = self.http_session
+        if session is None or session.closed:
+            return False
+        connector = getattr(session, "connector", None)
+        # HTTP2Session has no separate connector; its closed flag covers the pool
+        return connector is None or not connector.closed
+    
+    def on(self, event_name: str, callback: Callable, inline: bool = False, threaded: bool = False) -> None:
+        """
+        Register event handler.
+        
+        Handlers run as independent tasks on the event loop, so one handler
+        doesn't wait for another to be scheduled. Pass inline=True for cheap
+        handlers that must see the event before the triggering call returns
+        (e.g. cache invalidation). Pass threaded=True to run a plain
+        function in a small dedicated thread pool instead, for blocking
+        handlers that are safe to call off the event loop thread.
+        """
         if event_name in self.event_handlers:
             self.event_handlers[event_name].append(callback)
+            if inline:
+                self._inline_handlers.add(callback)
+            if threaded:
+                self._threaded_handlers.add(callback)
     
     def off(self, event_name: str, callback: Callable) -> None:
         """Remove event handler"""
         if event_name in self.event_handlers:
             if callback in self.event_handlers[event_name]:
                 self.event_handlers[event_name].remove(callback)
+                self._inline_handlers.discard(callback)
+                self._threaded_handlers.discard(callback)
     
     def _trigger_event(self, event_name: str, data: Any) -> None:
         """Trigger event handlers"""
         if event_name in self.event_handlers:
-            for handler in self.event_handlers[event_name]:
-                try:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+                
+            # Iterate over a copy so handlers can call off() while we dispatch
+            for handler in self.event_handlers[event_name][:]:
+                if loop is None or handler in self._inline_handlers:
+                    try:
+                        handler(data)
+                    except Exception as e:
+                        logger.error("Error in event handler for %s: %s", event_name, e)
+                    continue
+                    
+                task = loop.create_task(self._run_handler(event_name, handler, data))
+                self._handler_tasks.add(task)
+                task.add_done_callback(self._handler_tasks.discard)
+    
+    async def _run_handler(self, event_name: str, handler: Callable, data: Any) -> None:
+        """Run one event handler, bounded by the handler concurrency limit"""
+        if self._handler_slots is None:
+            self._handler_slots = asyncio.Semaphore(MAX_CONCURRENT_HANDLERS)
+            
+        async with self._handler_slots:
+            try:
+                if asyncio.iscoroutinefunction(handler):
+                    await handler(data)
+                elif handler not in self._threaded_handlers:
                     handler(data)
-                except Exception as e:
-                    logger.error(f"Error in event handler for {event_name}: {e}")
+                else:
+                    if self._handler_pool is None:
+                        self._handler_pool = ThreadPoolExecutor(
+                            max_workers=HANDLER_POOL_SIZE, 
+                            thread_name_prefix="interverse-handler"
+                        )
+                    await asyncio.get_running_loop().run_in_executor(self._handler_pool, handler, data)
+            except Exception as e:
+                logger.error("Error in event handler for %s: %s", event_name, e)
     
     async def close(self) -> None:
         """Close all connections and clean up resources"""
         await self.disconnect()
         
-        if self.http_session is not None and not self.http_session.closed:
-            await self.http_session.close()
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+            
+        # Pushed balances still waiting out BALANCE_EVENT_WINDOW are dropped
+        for timer in self._balance_timers.values():
+            timer.cancel()
+        self._balance_timers.clear()
+        self._pending_balances.clear()
+        
+        # Send any mints/transfers still waiting for their batch
+        await self._mint_batcher.drain()
+        await self._transfer_batcher.drain()
+        
+        if self.http_session is not None:
+            # A shared session stays open for the other instances using it
+            if self._owns_session and not self.http_session.closed:
+                await self.http_session.close()
             self.http_session = None
+            self._owns_session = False
             
-        logger.info("InterverseChain instance closed")
\ No newline at end of file
+        if self._handler_pool is not None:
+            # Let running handlers finish in the background
+            self._handler_pool.shutdown(wait=False)
+            self._handler_pool = None
+            
+        logger.info("InterverseChain instance closed")
+    
+    async def __aenter__(self) -> 'InterverseChain':
+        await self.initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
\ No newline at end of file
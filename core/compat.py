@@ -0,0 +1,97 @@
+"""
+Compatibility helpers shared by the core modules.
+
+Collects switches for Python-version specific features and optional
+accelerator packages so the rest of the SDK can use them without repeating
+version checks or import guards.
+"""
+
+import asyncio
+import json
+import sys
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Media types the node may answer with, preferring msgpack when it is available
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+ACCEPT_HEADER = "application/msgpack, application/json;q=0.9" if msgpack is not None else "application/json"
+
+# dataclass(slots=True) is only available on Python 3.10+; older versions
+# fall back to regular __dict__-backed instances
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson rejects a few things stdlib json accepts (e.g. non-str keys)
+            pass
+    return json.dumps(obj)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed
+
+    Raises json.JSONDecodeError on invalid input with either backend.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Serialize to msgpack bytes
+
+    Raises:
+        ImportError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required for this operation (pip install interverse-sdk[speedups])")
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """Parse msgpack bytes
+
+    Raises:
+        ImportError: If msgpack is not installed
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required for this operation (pip install interverse-sdk[speedups])")
+    return msgpack.unpackb(data, raw=False)
+
+
+def install_uvloop() -> bool:
+    """Make uvloop the default event loop policy if it is installed
+
+    Returns:
+        bool: True if uvloop was installed, False if it is unavailable
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
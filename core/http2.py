@@ -0,0 +1,123 @@
+"""
+HTTP/2 transport for InterverseChain.
+
+Wraps httpx.AsyncClient behind the small subset of the aiohttp.ClientSession
+interface the chain uses, so concurrent requests to a node can be
+multiplexed as streams over a single connection instead of each needing
+its own HTTP/1.1 connection.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Dict, Optional
+
+import aiohttp
+
+from .compat import httpx, json_dumps
+
+
+class HTTP2Response:
+    """Buffered response exposing the aiohttp.ClientResponse attributes the chain reads"""
+    
+    __slots__ = ("status", "headers", "content_type", "_content")
+    
+    def __init__(self, response: "httpx.Response"):
+        self.status = response.status_code
+        self.headers = response.headers
+        self.content_type = response.headers.get("content-type", "").split(";", 1)[0].strip()
+        self._content = response.content
+    
+    async def read(self) -> bytes:
+        return self._content
+    
+    async def text(self) -> str:
+        return self._content.decode("utf-8", errors="replace")
+
+
+class HTTP2Session:
+    """aiohttp.ClientSession look-alike backed by an HTTP/2 httpx.AsyncClient"""
+    
+    def __init__(
+        self, 
+        headers: Dict[str, str], 
+        pool_size: int, 
+        keepalive_connections: int, 
+        timeout: aiohttp.ClientTimeout
+    ):
+        if httpx is None:
+            raise ImportError("httpx is required for HTTP/2 (pip install interverse-sdk[http2])")
+        self.timeout = timeout
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=keepalive_connections,
+                keepalive_expiry=75
+            ),
+            timeout=self._convert_timeout(timeout)
+        )
+    
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+    
+    async def _send(
+        self, 
+        method: str, 
+        url: str, 
+        json: Any = None, 
+        params: Optional[Dict[str, Any]] = None, 
+        headers: Optional[Dict[str, str]] = None, 
+        timeout: Optional[aiohttp.ClientTimeout] = None
+    ) -> HTTP2Response:
+        """Send a request and buffer the whole response"""
+        try:
+            response = await self._client.request(
+                method,
+                url,
+                content=json_dumps(json) if json is not None else None,
+                params=params,
+                headers=headers,
+                timeout=self._convert_timeout(timeout or self.timeout)
+            )
+        except httpx.TimeoutException as e:
+            # Surface timeouts the same way aiohttp does
+            raise asyncio.TimeoutError(str(e)) from e
+        return HTTP2Response(response)
+    
+    def request(self, method: str, url: str, **kwargs: Any) -> "_ResponseContext":
+        """Send a request; the result can be awaited or used with ``async with``"""
+        return _ResponseContext(self._send(method, url, **kwargs))
+    
+    def get(self, url: str, **kwargs: Any) -> "_ResponseContext":
+        return self.request("GET", url, **kwargs)
+    
+    async def close(self) -> None:
+        await self._client.aclose()
+    
+    @staticmethod
+    def _convert_timeout(timeout: aiohttp.ClientTimeout) -> "httpx.Timeout":
+        """Map an aiohttp timeout onto httpx's per-phase timeouts"""
+        return httpx.Timeout(
+            timeout.total,
+            connect=timeout.connect or timeout.total,
+            read=timeout.sock_read or timeout.total
+        )
+
+
+class _ResponseContext:
+    """Lets ``async with session.request(...)`` work like it does with aiohttp"""
+    
+    __slots__ = ("_coro",)
+    
+    def __init__(self, coro: Awaitable[HTTP2Response]):
+        self._coro = coro
+    
+    def __await__(self):
+        return self._coro.__await__()
+    
+    async def __aenter__(self) -> HTTP2Response:
+        return await self._coro
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
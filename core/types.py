@@ -1,9 +1,22 @@
 from enum import Enum
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
-import json
+import sys
 from datetime import datetime
 
+from .compat import DATACLASS_SLOTS, json_dumps, json_loads, msgspec
+from ._schemas import TRANSACTION_DECODER, TRANSACTION_LIST_DECODER, DECODE_ERRORS
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing 'Z' and any ISO-8601 shape since 3.11
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC"""
+        if value[-1:] == 'Z':
+            return datetime.fromisoformat(value[:-1] + '+00:00')
+        return datetime.fromisoformat(value)
+
 class TransactionType(str, Enum):
     """Types of transactions supported by the blockchain"""
     TRANSFER = "TRANSFER"
@@ -19,11 +32,7 @@ class TransactionType(str, Enum):
     @classmethod
     def from_string(cls, type_str: str) -> 'TransactionType':
         """Convert string to TransactionType enum"""
-        type_str = type_str.upper()
-        for tx_type in cls:
-            if tx_type.value == type_str:
-                return tx_type
-        return cls.TRANSFER  # Default to TRANSFER if not found
+        return _TRANSACTION_TYPE_LOOKUP.get(type_str.upper(), cls.TRANSFER)  # Default to TRANSFER if not found
 
 class TransactionStatus(str, Enum):
     """Status of a transaction on the blockchain"""
@@ -35,13 +44,40 @@ class TransactionStatus(str, Enum):
     @classmethod
     def from_string(cls, status_str: str) -> 'TransactionStatus':
         """Convert string to TransactionStatus enum"""
-        status_str = status_str.lower()
-        for status in cls:
-            if status.value == status_str:
-                return status
-        return cls.PENDING  # Default to PENDING if not found
+        return _TRANSACTION_STATUS_LOOKUP.get(status_str.lower(), cls.PENDING)  # Default to PENDING if not found
+
+# Normalized value -> member tables used by from_string
+_TRANSACTION_TYPE_LOOKUP: Dict[str, TransactionType] = {t.value: t for t in TransactionType}
+_TRANSACTION_STATUS_LOOKUP: Dict[str, TransactionStatus] = {s.value: s for s in TransactionStatus}
+
+# Member -> value tables used by to_dict (cheaper than the Enum.value property)
+_TRANSACTION_TYPE_VALUES: Dict[TransactionType, str] = {t: t.value for t in TransactionType}
+_TRANSACTION_STATUS_VALUES: Dict[TransactionStatus, str] = {s: s.value for s in TransactionStatus}
 
-@dataclass
+def _transaction_type_of(value: Any) -> TransactionType:
+    """Transaction type for a raw wire value (anything but a known name is TRANSFER)"""
+    if isinstance(value, str):
+        return _TRANSACTION_TYPE_LOOKUP.get(value.upper(), TransactionType.TRANSFER)
+    return TransactionType.TRANSFER
+
+def _transaction_status_of(value: Any) -> TransactionStatus:
+    """Transaction status for a raw wire value (anything but a known name is pending)"""
+    if isinstance(value, str):
+        return _TRANSACTION_STATUS_LOOKUP.get(value.lower(), TransactionStatus.PENDING)
+    return TransactionStatus.PENDING
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an ISO-8601 string or Unix timestamp, falling back to the current time"""
+    try:
+        if isinstance(value, str):
+            return _parse_iso(value)
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value)
+    except Exception:
+        pass
+    return datetime.utcnow()
+
+@dataclass(**DATACLASS_SLOTS)
 class Transaction:
     """Represents a blockchain transaction"""
     id: str
@@ -57,41 +93,62 @@ class Transaction:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
         """Create transaction from dictionary"""
-        # Parse timestamp
-        timestamp = datetime.utcnow()
-        if "timestamp" in data:
-            try:
-                if isinstance(data["timestamp"], str):
-                    timestamp = datetime.fromisoformat(data["timestamp"].replace('Z', '+00:00'))
-                elif isinstance(data["timestamp"], (int, float)):
-                    timestamp = datetime.fromtimestamp(data["timestamp"])
-            except Exception:
-                pass
-                
-        # Parse transaction type
-        try:
-            tx_type = TransactionType.from_string(data.get("transaction_type", "TRANSFER"))
-        except Exception:
-            tx_type = TransactionType.TRANSFER
-            
-        # Parse status
-        try:
-            status = TransactionStatus.from_string(data.get("status", "pending"))
-        except Exception:
-            status = TransactionStatus.PENDING
-        
+        tx_id = data.get("id")
+        metadata = data.get("metadata")
         return cls(
-            id=data.get("id", ""),
+            id=str(tx_id) if tx_id is not None else "",
             sender_address=data.get("sender_address", ""),
             recipient_address=data.get("recipient_address", ""),
             amount=float(data.get("amount", 0.0)),
-            transaction_type=tx_type,
-            status=status,
-            timestamp=timestamp,
-            metadata=data.get("metadata", {}),
+            transaction_type=_transaction_type_of(data.get("transaction_type")),
+            status=_transaction_status_of(data.get("status")),
+            timestamp=_parse_timestamp(data.get("timestamp")),
+            metadata=metadata if metadata is not None else {},
             block_number=data.get("block_number")
         )
     
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str]) -> 'Transaction':
+        """
+        Create transaction from a raw JSON document.
+        
+        With msgspec installed the document is decoded straight into a typed
+        schema in native code, skipping the intermediate dict; otherwise this
+        is equivalent to from_dict(json_loads(data)).
+        """
+        try:
+            if msgspec is None:
+                return cls.from_dict(json_loads(data))
+            return cls._from_schema(TRANSACTION_DECODER.decode(data))
+        except DECODE_ERRORS as e:
+            raise ValueError(f"Invalid JSON format: {e}")
+    
+    @classmethod
+    def from_bytes_batch(cls, data: Union[bytes, str]) -> List['Transaction']:
+        """Create transactions from a raw JSON array (see from_bytes)"""
+        try:
+            if msgspec is None:
+                return [cls.from_dict(item) for item in json_loads(data)]
+            from_schema = cls._from_schema
+            return [from_schema(schema) for schema in TRANSACTION_LIST_DECODER.decode(data)]
+        except DECODE_ERRORS as e:
+            raise ValueError(f"Invalid JSON format: {e}")
+    
+    @classmethod
+    def _from_schema(cls, schema: Any) -> 'Transaction':
+        """Create transaction from a decoded TransactionSchema (same rules as from_dict)"""
+        return cls(
+            id=str(schema.id) if schema.id is not None else "",
+            sender_address=schema.sender_address,
+            recipient_address=schema.recipient_address,
+            amount=schema.amount,
+            transaction_type=_transaction_type_of(schema.transaction_type),
+            status=_transaction_status_of(schema.status),
+            timestamp=_parse_timestamp(schema.timestamp),
+            metadata=schema.metadata if schema.metadata is not None else {},
+            block_number=schema.block_number
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -99,14 +156,14 @@ class Transaction:
             "sender_address": self.sender_address,
             "recipient_address": self.recipient_address,
             "amount": self.amount,
-            "transaction_type": self.transaction_type.value,
-            "status": self.status.value,
+            "transaction_type": _TRANSACTION_TYPE_VALUES[self.transaction_type],
+            "status": _TRANSACTION_STATUS_VALUES[self.status],
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata,
             "block_number": self.block_number
         }
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GameLinkConfig:
     """Configuration for linking games together"""
     source_game_id: str
@@ -136,7 +193,7 @@ class GameLinkConfig:
             property_conversions=data.get("property_conversions", {})
         )
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PlayerIdentity:
     """Player identity information"""
     global_id: str
@@ -163,7 +220,7 @@ class PlayerIdentity:
         if "last_active" in data:
             try:
                 if isinstance(data["last_active"], str):
-                    last_active = datetime.fromisoformat(data["last_active"].replace('Z', '+00:00'))
+                    last_active = _parse_iso(data["last_active"])
             except Exception:
                 pass
                 
@@ -175,7 +232,7 @@ class PlayerIdentity:
             game_metadata=data.get("game_metadata", {})
         )
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GameRegistration:
     """Game registration information"""
     game_id: str
@@ -206,7 +263,7 @@ class GameRegistration:
         if "created_at" in data:
             try:
                 if isinstance(data["created_at"], str):
-                    created_at = datetime.fromisoformat(data["created_at"].replace('Z', '+00:00'))
+                    created_at = _parse_iso(data["created_at"])
             except Exception:
                 pass
                 
@@ -225,8 +282,16 @@ class ChainResponseStatus(str, Enum):
     SUCCESS = "success"
     ERROR = "error"
     PENDING = "pending"
+    
+    @classmethod
+    def from_string(cls, status_str: str) -> 'ChainResponseStatus':
+        """Convert string to ChainResponseStatus enum"""
+        return _CHAIN_STATUS_LOOKUP.get(status_str.lower(), cls.ERROR)  # Default to ERROR if not found
+
+_CHAIN_STATUS_LOOKUP: Dict[str, ChainResponseStatus] = {s.value: s for s in ChainResponseStatus}
+_CHAIN_STATUS_VALUES: Dict[ChainResponseStatus, str] = {s: s.value for s in ChainResponseStatus}
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChainResponse:
     """Standardized response format for chain operations"""
     status: ChainResponseStatus
@@ -237,7 +302,7 @@ class ChainResponse:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         result = {
-            "status": self.status.value,
+            "status": _CHAIN_STATUS_VALUES[self.status],
             "message": self.message
         }
         
@@ -251,7 +316,7 @@ class ChainResponse:
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        return json_dumps(self.to_dict())
     
     @classmethod
     def success(cls, message: str = "Operation successful", data: Optional[Dict[str, Any]] = None) -> 'ChainResponse':
@@ -1,16 +1,59 @@
-import json
+import asyncio
 import os
+import sys
 import base64
 import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from .compat import json_dumps, json_loads
+from .types import TransactionType, _parse_iso
+
 logger = logging.getLogger("interverse.wallet")
 
+WALLET_KEY_SALT = b'interverse-salt'
+
+# Interned so comparisons against interned strings (e.g. dict keys) hit the identity fast path
+_TRANSFER = sys.intern(TransactionType.TRANSFER.value)
+
+# Seconds a freshly fetched balance is reused by get_active_wallet
+ACTIVE_BALANCE_TTL = 5.0
+
+
+def _derive_key(password: str, salt: bytes) -> bytes:
+    """Derive a wallet encryption key (100k PBKDF2-SHA256 rounds; WalletStorage caches results)"""
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
+
+
+def _fallback_transaction_id(transaction: Dict[str, Any]) -> str:
+    """Stable key for a transaction without an id, so refetching it doesn't record it twice"""
+    get = transaction.get
+    fields = (get("sender"), get("recipient"), get("amount"), get("timestamp"), get("type"))
+    return "#" + hashlib.sha256(repr(fields).encode('utf-8')).hexdigest()
+
+
+def _xor_bytes(data: bytes, key: bytes) -> bytes:
+    """XOR data with a repeating key in one big-integer operation (legacy wallet files)"""
+    if not data:
+        return b""
+    keystream = (key * (len(data) // len(key) + 1))[:len(data)]
+    result = int.from_bytes(data, "little") ^ int.from_bytes(keystream, "little")
+    return result.to_bytes(len(data), "little")
+
+
 class InterverseWallet:
     """Wallet management for Interverse chain"""
     
+    __slots__ = (
+        "address", "balance", "public_key", "_private_key", 
+        "created_at", "last_updated", "transactions"
+    )
+    
     def __init__(
         self, 
         address: str = "",
@@ -25,7 +68,7 @@ class InterverseWallet:
         self._private_key = private_key  # Store privately
         self.created_at = created_at or datetime.utcnow()
         self.last_updated = datetime.utcnow()
-        self.transactions: List[Dict[str, Any]] = []
+        self.transactions: Dict[str, Dict[str, Any]] = {}  # tx id -> transaction, in arrival order
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'InterverseWallet':
@@ -34,7 +77,7 @@ class InterverseWallet:
         if "created_at" in data:
             try:
                 if isinstance(data["created_at"], str):
-                    created_at = datetime.fromisoformat(data["created_at"].replace('Z', '+00:00'))
+                    created_at = _parse_iso(data["created_at"])
                 elif isinstance(data["created_at"], (int, float)):
                     created_at = datetime.fromtimestamp(data["created_at"])
             except Exception as e:
@@ -65,7 +108,7 @@ class InterverseWallet:
     
     def to_json(self, include_private: bool = False) -> str:
         """Convert wallet to JSON string"""
-        return json.dumps(self.to_dict(include_private=include_private))
+        return json_dumps(self.to_dict(include_private=include_private))
     
     @property
     def has_private_key(self) -> bool:
@@ -77,18 +120,46 @@ class InterverseWallet:
         self.balance = float(new_balance)
         self.last_updated = datetime.utcnow()
     
-    def add_transaction(self, transaction: Dict[str, Any]) -> None:
-        """Add transaction to wallet history"""
-        self.transactions.append(transaction)
+    def add_transaction(self, transaction: Dict[str, Any]) -> bool:
+        """Add transaction to wallet history
+        
+        Returns False (and leaves the balance alone) if a transaction with
+        the same id is already recorded.
+        """
+        if not self._record_transaction(transaction):
+            return False
+        self.last_updated = datetime.utcnow()
+        return True
+    
+    def add_transactions(self, transactions: List[Dict[str, Any]]) -> int:
+        """Add several transactions to wallet history, returning how many were new"""
+        added = 0
+        for transaction in transactions:
+            if self._record_transaction(transaction):
+                added += 1
+        if added:
+            self.last_updated = datetime.utcnow()
+        return added
+    
+    def _record_transaction(self, transaction: Dict[str, Any]) -> bool:
+        """Store a transaction and apply it to the balance, unless its id is known"""
+        get = transaction.get
+        tx_id = get("id") or _fallback_transaction_id(transaction)
+        if tx_id in self.transactions:
+            return False
+        self.transactions[tx_id] = transaction
         
         # Update balance if transaction has amount
         if "amount" in transaction:
-            if transaction.get("type") == "TRANSFER" and transaction.get("sender") == self.address:
+            if get("type") == _TRANSFER and get("sender") == self.address:
                 self.balance -= float(transaction["amount"])
-            elif transaction.get("recipient") == self.address:
+            elif get("recipient") == self.address:
                 self.balance += float(transaction["amount"])
-                
-        self.last_updated = datetime.utcnow()
+        return True
+    
+    def get_transaction(self, tx_id: str) -> Optional[Dict[str, Any]]:
+        """Get a recorded transaction by id"""
+        return self.transactions.get(tx_id)
     
     def clear_private_key(self) -> None:
         """Clear private key from memory for security"""
@@ -110,35 +181,65 @@ class WalletStorage:
         os.makedirs(self.storage_dir, exist_ok=True)
         
         self.wallets: Dict[str, InterverseWallet] = {}
+        
+        # Derived keys by (SHA-256 of password, salt), so the password itself is never kept
+        self._key_cache: Dict[Tuple[bytes, bytes], bytes] = {}
     
     def load_wallets(self, password: Optional[str] = None) -> int:
         """Load all wallets from storage"""
         count = 0
         try:
-            for filename in os.listdir(self.storage_dir):
-                if filename.endswith('.json'):
-                    wallet_path = os.path.join(self.storage_dir, filename)
-                    try:
-                        with open(wallet_path, 'r') as f:
-                            wallet_data = json.load(f)
-                            
-                        # Handle encrypted files
-                        if wallet_data.get("encrypted", False) and password:
-                            wallet_data = self._decrypt_wallet_data(wallet_data, password)
-                            
-                        wallet = InterverseWallet.from_dict(wallet_data)
-                        self.wallets[wallet.address] = wallet
-                        count += 1
-                            
-                    except Exception as e:
-                        logger.error(f"Error loading wallet {filename}: {e}")
+            if password:
+                # Derive the key once up front instead of in every loader thread
+                self._wallet_key(password)
+                
+            with os.scandir(self.storage_dir) as entries:
+                paths = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                ]
+            
+            # File reads and decryption release the GIL, so load files in parallel
+            with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1) or 1) as executor:
+                wallets = list(executor.map(self._load_wallet_file, paths, [password] * len(paths)))
+                
+            for wallet in wallets:
+                if wallet is not None:
+                    self.wallets[wallet.address] = wallet
+                    count += 1
         except Exception as e:
             logger.error(f"Error loading wallets: {e}")
+        finally:
+            self.clear_key_cache()
             
         return count
     
+    def _load_wallet_file(self, wallet_path: str, password: Optional[str]) -> Optional[InterverseWallet]:
+        """Read (and decrypt) one wallet file, or return None if it can't be loaded"""
+        try:
+            with open(wallet_path, 'rb') as f:
+                wallet_data = json_loads(f.read())
+                
+            # Handle encrypted files
+            if wallet_data.get("encrypted", False) and password:
+                wallet_data = self._decrypt_wallet_data(wallet_data, password)
+                
+            return InterverseWallet.from_dict(wallet_data)
+            
+        except Exception as e:
+            logger.error(f"Error loading wallet {os.path.basename(wallet_path)}: {e}")
+            return None
+    
     def save_wallet(self, wallet: InterverseWallet, password: Optional[str] = None) -> bool:
         """Save wallet to storage"""
+        try:
+            return self._save_wallet(wallet, password)
+        finally:
+            self.clear_key_cache()
+    
+    def _save_wallet(self, wallet: InterverseWallet, password: Optional[str]) -> bool:
+        """Save wallet to storage, keeping the derived key cached for the rest of a batch"""
         try:
             wallet_data = wallet.to_dict(include_private=True)
             
@@ -149,8 +250,18 @@ class WalletStorage:
             filename = f"{wallet.address}.json"
             wallet_path = os.path.join(self.storage_dir, filename)
             
-            with open(wallet_path, 'w') as f:
-                json.dump(wallet_data, f, indent=2)
+            # Write to a temporary file and swap it in, so a crash never leaves a truncated wallet
+            temp_path = wallet_path + ".tmp"
+            try:
+                with open(temp_path, 'wb') as f:
+                    f.write(json_dumps(wallet_data).encode('utf-8'))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, wallet_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
                 
             # Add to memory cache
             self.wallets[wallet.address] = wallet
@@ -160,6 +271,13 @@ class WalletStorage:
             logger.error(f"Error saving wallet {wallet.address}: {e}")
             return False
     
+    def save_all(self, password: Optional[str] = None) -> int:
+        """Save every loaded wallet, returning how many were saved"""
+        try:
+            return sum(self._save_wallet(wallet, password) for wallet in self.get_all_wallets())
+        finally:
+            self.clear_key_cache()
+    
     def get_wallet(self, address: str) -> Optional[InterverseWallet]:
         """Get wallet by address"""
         return self.wallets.get(address)
@@ -186,58 +304,60 @@ class WalletStorage:
             logger.error(f"Error deleting wallet {address}: {e}")
             return False
     
+    def clear_key_cache(self) -> None:
+        """Forget keys derived from wallet passwords (done after load_wallets, save_all and save_wallet)"""
+        self._key_cache.clear()
+    
+    def _wallet_key(self, password: str) -> bytes:
+        """Get the encryption key for a password, deriving it on first use"""
+        cache_key = (hashlib.sha256(password.encode('utf-8')).digest(), WALLET_KEY_SALT)
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            key = self._key_cache[cache_key] = _derive_key(password, WALLET_KEY_SALT)
+        return key
+    
     def _encrypt_wallet_data(self, wallet_data: Dict[str, Any], password: str) -> Dict[str, Any]:
-        """Encrypt wallet data with password"""
-        # Simple encryption for demonstration
-        # In production, use a proper encryption library
-        
+        """Encrypt wallet data with password (AES-256-GCM)"""
         # Generate key from password
-        key = hashlib.pbkdf2_hmac(
-            'sha256', 
-            password.encode('utf-8'), 
-            b'interverse-salt', 
-            100000
-        )
+        key = self._wallet_key(password)
         
         # Convert wallet data to string
-        data_str = json.dumps(wallet_data)
-        
-        # XOR encryption (very basic, for demonstration only)
-        key_bytes = key
-        data_bytes = data_str.encode('utf-8')
-        encrypted_bytes = bytearray()
+        data_str = json_dumps(wallet_data)
         
-        for i in range(len(data_bytes)):
-            encrypted_bytes.append(data_bytes[i] ^ key_bytes[i % len(key_bytes)])
+        # AES-GCM authenticates the data, so a wrong password fails instead of returning garbage
+        nonce = os.urandom(12)
+        encrypted_bytes = AESGCM(key).encrypt(nonce, data_str.encode('utf-8'), None)
         
         # Return encrypted data
         return {
             "encrypted": True,
+            "cipher": "aes-256-gcm",
+            "nonce": base64.b64encode(nonce).decode('utf-8'),
             "data": base64.b64encode(encrypted_bytes).decode('utf-8')
         }
     
     def _decrypt_wallet_data(self, encrypted_data: Dict[str, Any], password: str) -> Dict[str, Any]:
-        """Decrypt wallet data with password"""
+        """Decrypt wallet data with password
+        
+        Raises cryptography.exceptions.InvalidTag if the password is wrong
+        or the file was tampered with.
+        """
         # Generate key from password
-        key = hashlib.pbkdf2_hmac(
-            'sha256', 
-            password.encode('utf-8'), 
-            b'interverse-salt', 
-            100000
-        )
+        key = self._wallet_key(password)
         
         # Decode encrypted data
         encrypted_bytes = base64.b64decode(encrypted_data.get("data", ""))
         
-        # XOR decryption
-        key_bytes = key
-        decrypted_bytes = bytearray()
-        
-        for i in range(len(encrypted_bytes)):
-            decrypted_bytes.append(encrypted_bytes[i] ^ key_bytes[i % len(key_bytes)])
+        if "nonce" in encrypted_data:
+            nonce = base64.b64decode(encrypted_data["nonce"])
+            decrypted_bytes = AESGCM(key).decrypt(nonce, encrypted_bytes, None)
+        else:
+            # Files written before AES-GCM was introduced used a plain XOR stream;
+            # they are re-encrypted the next time the wallet is saved
+            decrypted_bytes = _xor_bytes(encrypted_bytes, key)
         
         # Convert back to dictionary
-        return json.loads(decrypted_bytes.decode('utf-8'))
+        return json_loads(decrypted_bytes)
 
 
 class WalletManager:
@@ -247,6 +367,7 @@ class WalletManager:
         self.chain = chain  # InterverseChain instance
         self.storage = WalletStorage(storage_dir)
         self.active_wallet: Optional[InterverseWallet] = None
+        self._balance_fetched_at: Dict[str, float] = {}  # address -> monotonic time of last balance fetch
     
     async def create_wallet(self) -> Tuple[bool, Optional[InterverseWallet], str]:
         """Create a new wallet"""
@@ -289,6 +410,7 @@ class WalletManager:
             
             if balance_result.get("success", False):
                 wallet.update_balance(balance_result.get("balance", wallet.balance))
+                self._balance_fetched_at[address] = time.monotonic()
                 
             # Set as active wallet
             self.active_wallet = wallet
@@ -301,12 +423,18 @@ class WalletManager:
     
     async def get_active_wallet(self) -> Optional[InterverseWallet]:
         """Get the currently active wallet"""
-        if self.active_wallet:
+        wallet = self.active_wallet
+        if wallet:
+            # Skip the round trip if the balance was just fetched
+            if time.monotonic() - self._balance_fetched_at.get(wallet.address, 0.0) < ACTIVE_BALANCE_TTL:
+                return wallet
+                
             # Update balance
-            balance_result = await self.chain.get_balance(self.active_wallet.address)
+            balance_result = await self.chain.get_balance(wallet.address)
             
             if balance_result.get("success", False):
-                self.active_wallet.update_balance(balance_result.get("balance", self.active_wallet.balance))
+                wallet.update_balance(balance_result.get("balance", wallet.balance))
+                self._balance_fetched_at[wallet.address] = time.monotonic()
                 
         return self.active_wallet
     
@@ -321,18 +449,24 @@ class WalletManager:
     async def update_balances(self) -> Dict[str, float]:
         """Update balances for all wallets"""
         updated_balances = {}
+        wallets = list(self.storage.wallets.items())
         
-        for address, wallet in self.storage.wallets.items():
-            try:
-                balance_result = await self.chain.get_balance(address)
+        # Fetch every balance concurrently rather than one round trip at a time
+        results = await asyncio.gather(
+            *(self.chain.get_balance(address) for address, _ in wallets),
+            return_exceptions=True
+        )
+        
+        for (address, wallet), balance_result in zip(wallets, results):
+            if isinstance(balance_result, BaseException):
+                logger.error(f"Error updating balance for {address}: {balance_result}")
+                continue
                 
-                if balance_result.get("success", False):
-                    new_balance = balance_result.get("balance", wallet.balance)
-                    wallet.update_balance(new_balance)
-                    updated_balances[address] = new_balance
-                    
-            except Exception as e:
-                logger.error(f"Error updating balance for {address}: {e}")
+            if balance_result.get("success", False):
+                new_balance = balance_result.get("balance", wallet.balance)
+                wallet.update_balance(new_balance)
+                self._balance_fetched_at[address] = time.monotonic()
+                updated_balances[address] = new_balance
                 
         return updated_balances
     
@@ -346,9 +480,11 @@ class WalletManager:
             if wallet:
                 count += await self._update_wallet_transactions(wallet)
         else:
-            # Update all wallets
-            for wallet in self.storage.get_all_wallets():
-                count += await self._update_wallet_transactions(wallet)
+            # Update all wallets concurrently
+            counts = await asyncio.gather(
+                *(self._update_wallet_transactions(wallet) for wallet in self.storage.get_all_wallets())
+            )
+            count = sum(counts)
                 
         return count
     
@@ -362,12 +498,8 @@ class WalletManager:
                 
             transactions = tx_result.get("transactions", [])
             
-            # Clear existing transactions and add new ones
-            wallet.transactions = []
-            for tx in transactions:
-                wallet.add_transaction(tx)
-                
-            return len(transactions)
+            # Merge into the known history; already recorded ids are skipped
+            return wallet.add_transactions(transactions)
             
         except Exception as e:
             logger.error(f"Error updating transactions for {wallet.address}: {e}")
@@ -5,6 +5,7 @@ for Interverse SDK to create and apply material styles to game assets.
 """
 
 import asyncio
+import copy
 from interverse import create_interverse_sdk, ItemCategory, Rarity, Color
 from interverse.extensions.material_styles import MaterialStylesExtension, MaterialStyle
 
@@ -91,10 +92,8 @@ async def main():
         tags=["shadow", "dark", "ethereal"]
     )
     
-    # Register styles
-    await material_ext.register_style(fire_style)
-    await material_ext.register_style(ice_style)
-    await material_ext.register_style(shadow_style)
+    # Register styles (one request for all three)
+    await material_ext.register_styles([fire_style, ice_style, shadow_style])
     
     print("Registered material styles")
     
@@ -115,57 +114,49 @@ async def main():
         "tags": ["melee", "two_handed"]
     }
     
-    # Create a sword asset with the fire style
-    print("Creating fire sword...")
-    fire_sword_result = await material_ext.create_asset_with_style(
-        player_address, 
-        sword_properties,
-        "fire_style"
+    # Derive the ice sword from the same base (deep copy so the nested
+    # property dicts of the fire sword are left untouched)
+    ice_sword_properties = copy.deepcopy(sword_properties)
+    ice_sword_properties["string_properties"]["effect"] = "ice"
+    ice_sword_properties["numeric_properties"]["damage"] = 65  # Less damage but...
+    ice_sword_properties["numeric_properties"]["critical_chance"] = 15  # Higher crit chance
+    
+    # Create the fire and ice swords concurrently
+    print("Creating fire and ice swords...")
+    fire_sword_result, ice_sword_result = await asyncio.gather(
+        material_ext.create_asset_with_style(player_address, sword_properties, "fire_style"),
+        material_ext.create_asset_with_style(player_address, ice_sword_properties, "ice_style")
     )
     
-    if fire_sword_result["success"]:
-        fire_sword_id = fire_sword_result["asset"]["id"]
-        print(f"Created fire sword: {fire_sword_id}")
-        
-        # Modify sword properties to make it an ice sword
-        ice_sword_properties = sword_properties.copy()
-        ice_sword_properties["string_properties"]["effect"] = "ice"
-        ice_sword_properties["numeric_properties"]["damage"] = 65  # Less damage but...
-        ice_sword_properties["numeric_properties"]["critical_chance"] = 15  # Higher crit chance
-        
-        # Create an ice sword
-        print("Creating ice sword...")
-        ice_sword_result = await material_ext.create_asset_with_style(
-            player_address, 
-            ice_sword_properties,
-            "ice_style"
-        )
+    if not fire_sword_result["success"]:
+        print(f"Failed to create fire sword: {fire_sword_result.get('error', 'Unknown error')}")
+        return
+    if not ice_sword_result["success"]:
+        print(f"Failed to create ice sword: {ice_sword_result.get('error', 'Unknown error')}")
+        return
         
-        if ice_sword_result["success"]:
-            ice_sword_id = ice_sword_result["asset"]["id"]
-            print(f"Created ice sword: {ice_sword_id}")
-            
-            # Get all player assets
-            player_assets = await sdk.get_player_assets(player_address)
-            print(f"Player has {len(player_assets['assets'])} assets")
-            
-            # Show available styles
-            print("\nAvailable styles:")
-            for style in material_ext.get_all_styles():
-                print(f"- {style.name}: {style.description}")
-            
-            # Apply shadow style to the ice sword as an example of changing styles
-            print("\nTransforming ice sword to shadow sword...")
-            shadow_result = await material_ext.apply_style_to_asset(ice_sword_id, "shadow_style")
-            
-            if shadow_result["success"]:
-                print("Ice sword transformed to shadow sword!")
-            else:
-                print(f"Failed to apply shadow style: {shadow_result.get('error', 'Unknown error')}")
-        else:
-            print(f"Failed to create ice sword: {ice_sword_result.get('error', 'Unknown error')}")
+    fire_sword_id = fire_sword_result["asset"]["id"]
+    print(f"Created fire sword: {fire_sword_id}")
+    ice_sword_id = ice_sword_result["asset"]["id"]
+    print(f"Created ice sword: {ice_sword_id}")
+    
+    # Get all player assets
+    player_assets = await sdk.get_player_assets(player_address)
+    print(f"Player has {len(player_assets['assets'])} assets")
+    
+    # Show available styles
+    print("\nAvailable styles:")
+    for style in material_ext.iter_styles():
+        print(f"- {style.name}: {style.description}")
+    
+    # Apply shadow style to the ice sword as an example of changing styles
+    print("\nTransforming ice sword to shadow sword...")
+    shadow_result = await material_ext.apply_style_to_asset(ice_sword_id, "shadow_style")
+    
+    if shadow_result["success"]:
+        print("Ice sword transformed to shadow sword!")
     else:
-        print(f"Failed to create fire sword: {fire_sword_result.get('error', 'Unknown error')}")
+        print(f"Failed to apply shadow style: {shadow_result.get('error', 'Unknown error')}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
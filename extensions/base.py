@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Type, Union
 
 class InterverseExtension(ABC):
     """Base interface for all Interverse extensions"""
@@ -91,8 +92,24 @@ class ExtensionRegistry:
     
     def __init__(self, sdk):
         self.sdk = sdk
-        self.extensions = {}
-        self.enabled_extensions = set()
+        self._classes: Dict[str, Type[InterverseExtension]] = {}  # Registered classes by ID
+        self._prototypes: Dict[str, InterverseExtension] = {}  # Instances created at registration, for info
+        self._enabled: Dict[str, InterverseExtension] = {}  # Live instances of enabled extensions
+    
+    @property
+    def extensions(self) -> Mapping[str, Union[Type[InterverseExtension], InterverseExtension]]:
+        """
+        Read-only view of registered extensions by ID
+        
+        Maps to the live instance for enabled extensions and to the class
+        for the others.
+        """
+        return MappingProxyType({**self._classes, **self._enabled})
+    
+    @property
+    def enabled_extensions(self) -> FrozenSet[str]:
+        """IDs of the enabled extensions"""
+        return frozenset(self._enabled)
     
     def register_extension(self, extension_class) -> bool:
         """
@@ -109,10 +126,11 @@ class ExtensionRegistry:
             temp_instance = extension_class()
             extension_id = temp_instance.extension_id
             
-            if extension_id in self.extensions:
+            if extension_id in self._classes:
                 return False
                 
-            self.extensions[extension_id] = extension_class
+            self._classes[extension_id] = extension_class
+            self._prototypes[extension_id] = temp_instance
             return True
             
         except Exception as e:
@@ -130,17 +148,18 @@ class ExtensionRegistry:
         Returns:
             Extension instance if successful, None otherwise
         """
-        if extension_id not in self.extensions:
+        extension = self._enabled.get(extension_id)
+        if extension is not None:
+            # Already enabled, return the existing instance
+            return extension
+            
+        extension_class = self._classes.get(extension_id)
+        if extension_class is None:
             self.sdk.logger.error(f"Extension not found: {extension_id}")
             return None
             
-        if extension_id in self.enabled_extensions:
-            # Already enabled, return the existing instance
-            return self.get_extension(extension_id)
-            
         try:
             # Create instance
-            extension_class = self.extensions[extension_id]
             extension = extension_class()
             
             # Initialize with SDK
@@ -152,11 +171,8 @@ class ExtensionRegistry:
             if config:
                 extension.configure(config)
                 
-            # Add to enabled extensions
-            self.enabled_extensions.add(extension_id)
-            
-            # Store instance
-            self.extensions[extension_id] = extension
+            # Store as enabled
+            self._enabled[extension_id] = extension
             
             return extension
             
@@ -174,15 +190,13 @@ class ExtensionRegistry:
         Returns:
             bool: True if disabling was successful
         """
-        if extension_id not in self.enabled_extensions:
+        extension = self._enabled.get(extension_id)
+        if extension is None:
             return False
             
         try:
-            extension = self.get_extension(extension_id)
-            if extension:
-                extension.cleanup()
-                
-            self.enabled_extensions.remove(extension_id)
+            extension.cleanup()
+            del self._enabled[extension_id]
             return True
             
         except Exception as e:
@@ -199,10 +213,7 @@ class ExtensionRegistry:
         Returns:
             Extension instance if enabled, None otherwise
         """
-        if extension_id not in self.enabled_extensions:
-            return None
-            
-        return self.extensions.get(extension_id)
+        return self._enabled.get(extension_id)
     
     def get_all_extensions(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -213,27 +224,20 @@ class ExtensionRegistry:
         """
         result = {}
         
-        for ext_id, ext in self.extensions.items():
-            if ext_id in self.enabled_extensions:
-                # For enabled extensions, use the instance
-                if isinstance(ext, InterverseExtension):
-                    info = ext.get_extension_info()
-                    info["enabled"] = True
-                    result[ext_id] = info
-            else:
-                # For disabled extensions, create temporary instance
-                try:
-                    if not isinstance(ext, InterverseExtension):
-                        temp = ext()
-                        info = temp.get_extension_info()
-                        info["enabled"] = False
-                        result[ext_id] = info
-                except Exception:
-                    pass
-                    
+        for ext_id in self._classes:
+            # Enabled extensions report from their live instance, others from the registration instance
+            extension = self._enabled.get(ext_id)
+            enabled = extension is not None
+            try:
+                info = (extension if enabled else self._prototypes[ext_id]).get_extension_info()
+                info["enabled"] = enabled
+                result[ext_id] = info
+            except Exception:
+                pass
+                
         return result
     
     def cleanup_all(self) -> None:
         """Clean up all enabled extensions"""
-        for ext_id in list(self.enabled_extensions):
+        for ext_id in list(self._enabled):
             self.disable_extension(ext_id)
\ No newline at end of file
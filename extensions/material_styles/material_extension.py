@@ -1,13 +1,25 @@
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
+from collections import defaultdict
 from dataclasses import dataclass, field
+import asyncio
 import json
 import logging
+import sys
 
 from ...core.asset import Color
+from ...core.compat import DATACLASS_SLOTS, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Default limit on style/asset operations in flight against the node at once
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string so equal tags, game IDs and paths across styles share one object"""
+    return sys.intern(value) if type(value) is str else value
+
 class MaterialProperty(Enum):
     """Standard material properties that can be controlled by styles"""
     DIFFUSE_COLOR = "diffuse_color"
@@ -19,9 +31,13 @@ class MaterialProperty(Enum):
     EMISSION_STRENGTH = "emission_strength"
     TRANSPARENCY = "transparency"
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MaterialStyle:
-    """Represents a reusable material style that can be applied to assets"""
+    """
+    Represents a reusable material style that can be applied to assets.
+    
+    Styles are immutable; use dataclasses.replace() to derive a changed copy.
+    """
     id: str
     name: str
     description: str = ""
@@ -39,28 +55,72 @@ class MaterialStyle:
     compatible_games: List[str] = field(default_factory=list)
     base_style: Optional[str] = None
     
+    # color_overrides as plain dicts, built at construction
+    _color_dicts: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    # Serialized forms, built on first use (set with object.__setattr__ as the instance is frozen)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _patch: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Tags, game IDs and texture paths repeat across many styles
+        object.__setattr__(self, "tags", [_intern(tag) for tag in self.tags])
+        object.__setattr__(self, "compatible_games", [_intern(game_id) for game_id in self.compatible_games])
+        object.__setattr__(self, "texture_overrides", {
+            _intern(key): _intern(path) for key, path in self.texture_overrides.items()
+        })
+        object.__setattr__(self, "_color_dicts", {
+            key: color.to_dict() if hasattr(color, 'to_dict') else color
+            for key, color in self.color_overrides.items()
+        })
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert style to dictionary for API serialization"""
-        color_dict = {}
-        for key, color in self.color_overrides.items():
-            color_dict[key] = color.to_dict() if hasattr(color, 'to_dict') else color
-            
-        return {
+        """
+        Convert style to dictionary for API serialization.
+        
+        The result is cached; modifying the style's dicts or lists in place
+        does not refresh it.
+        """
+        if self._dict is not None:
+            return self._dict
+        object.__setattr__(self, "_dict", {
             "id": self.id,
             "name": self.name,
             "description": self.description,
             "texture_overrides": self.texture_overrides,
-            "color_overrides": color_dict,
+            "color_overrides": self._color_dicts,
             "numeric_parameters": self.numeric_parameters,
             "string_parameters": self.string_parameters,
             "tags": self.tags,
             "compatible_games": self.compatible_games,
             "base_style": self.base_style
-        }
+        })
+        return self._dict
     
     def to_json(self) -> str:
         """Convert to JSON string"""
-        return json.dumps(self.to_dict())
+        if self._json is None:
+            object.__setattr__(self, "_json", json_dumps(self.to_dict()))
+        return self._json
+    
+    def _style_patch(self) -> Dict[str, Any]:
+        """
+        The asset properties this style sets, in asset dictionary form.
+        
+        The result is cached like to_dict; callers merge it into asset
+        properties and must not modify it.
+        """
+        if self._patch is None:
+            patch: Dict[str, Any] = {
+                "numeric_properties": self.numeric_parameters,
+                "string_properties": self.string_parameters
+            }
+            for key in ("primary_color", "secondary_color"):
+                if key in self._color_dicts:
+                    patch[key] = self._color_dicts[key]
+            object.__setattr__(self, "_patch", patch)
+        return self._patch
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MaterialStyle':
@@ -91,7 +151,7 @@ class MaterialStyle:
     def from_json(cls, json_str: str) -> 'MaterialStyle':
         """Create style from JSON string"""
         try:
-            data = json.loads(json_str)
+            data = json_loads(json_str)
             return cls.from_dict(data)
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON for style: {e}")
@@ -107,58 +167,153 @@ class MaterialStylesExtension:
     - Converting styles between games
     """
     
-    def __init__(self, sdk):
+    def __init__(self, sdk, config: Optional[Dict[str, Any]] = None):
         self.sdk = sdk
+        self.config: Dict[str, Any] = dict(config or {})
+        self._request_slots: Optional[asyncio.Semaphore] = None  # Created on first use
         self.registered_styles: Dict[str, MaterialStyle] = {}
         self.style_mappings: Dict[str, Dict[str, str]] = {}
+        # Inverted indices over registered_styles for the tag and game lookups
+        self._by_tag: Dict[str, Dict[str, MaterialStyle]] = defaultdict(dict)
+        self._by_game: Dict[str, Dict[str, MaterialStyle]] = defaultdict(dict)
+        self._all_game_styles: Dict[str, MaterialStyle] = {}  # Styles with no compatible_games
+        self._batch_register_supported = True  # Cleared when the node lacks register_batch
+        self._apply_style_supported = True  # Cleared when the node lacks assets/{id}/apply_style
         logger.info("Material Styles Extension initialized")
     
+    def configure(self, config: Dict[str, Any]) -> bool:
+        """
+        Configure the extension with custom settings
+        
+        Supported keys:
+            max_concurrency: Maximum number of style/asset operations sent to
+                the node at the same time (default 10)
+        """
+        self.config.update(config)
+        if "max_concurrency" in config:
+            # Operations already waiting keep the old limit; new ones use the new one
+            self._request_slots = None
+        return True
+    
+    def get_config(self) -> Dict[str, Any]:
+        """Get current extension configuration"""
+        return self.config
+    
+    def _slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent operations against the node"""
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+        return self._request_slots
+    
     async def register_style(self, style: MaterialStyle) -> bool:
         """Register a new material style"""
-        if not style.id:
+        return await self.register_styles([style])
+    
+    async def register_styles(self, styles: List[MaterialStyle]) -> bool:
+        """
+        Register several material styles with a single request to the node.
+        
+        Falls back to one request per style if the node has no batch
+        endpoint. Styles are always stored locally, even if registering them
+        on the blockchain fails.
+        """
+        if any(not style.id for style in styles):
             logger.error("Style must have an ID")
             return False
             
         # Store locally
-        self.registered_styles[style.id] = style
+        for style in styles:
+            previous = self.registered_styles.get(style.id)
+            if previous is not None:
+                self._unindex_style(previous)
+            self.registered_styles[style.id] = style
+            self._index_style(style)
         
         # Register on blockchain if connected
         try:
-            if self.sdk.chain.is_connected:
-                await self.sdk.chain.http_session.post(
-                    f"{self.sdk.chain.node_url}/verse/material_styles/register",
-                    json=style.to_dict(),
-                    headers={"X-API-Key": self.sdk.chain.api_key, "Content-Type": "application/json"}
-                )
-                logger.info(f"Registered style on blockchain: {style.id}")
+            if styles and self.sdk.chain.is_connected:
+                await self._register_on_chain(styles)
         except Exception as e:
             logger.error(f"Failed to register style on blockchain: {e}")
             # Continue even if blockchain registration failed - we still have it locally
         
-        logger.info(f"Material style registered: {style.id}")
+        for style in styles:
+            logger.info(f"Material style registered: {style.id}")
         return True
     
+    def _index_style(self, style: MaterialStyle) -> None:
+        """Add a style to the tag and game indices"""
+        for tag in style.tags:
+            self._by_tag[tag][style.id] = style
+        if style.compatible_games:
+            for game_id in style.compatible_games:
+                self._by_game[game_id][style.id] = style
+        else:
+            self._all_game_styles[style.id] = style
+    
+    def _unindex_style(self, style: MaterialStyle) -> None:
+        """Remove a style from the tag and game indices"""
+        for tag in style.tags:
+            self._by_tag[tag].pop(style.id, None)
+        for game_id in style.compatible_games:
+            self._by_game[game_id].pop(style.id, None)
+        self._all_game_styles.pop(style.id, None)
+    
+    async def _register_on_chain(self, styles: List[MaterialStyle]) -> None:
+        """Send style registrations to the node, batched when it supports it"""
+        chain = self.sdk.chain
+        if len(styles) > 1 and self._batch_register_supported:
+            async with self._slots():
+                result = await chain.register_material_styles([style.to_dict() for style in styles])
+            if result is not None:
+                if result["success"]:
+                    logger.info(f"Registered {len(styles)} styles on blockchain")
+                return
+            # Older nodes only have the single-style endpoint
+            self._batch_register_supported = False
+            
+        async def register_one(style: MaterialStyle) -> Dict[str, Any]:
+            async with self._slots():
+                return await chain.register_material_style(style.to_dict())
+                
+        results = await asyncio.gather(*(register_one(style) for style in styles))
+        for style, result in zip(styles, results):
+            if result["success"]:
+                logger.info(f"Registered style on blockchain: {style.id}")
+    
     def get_style(self, style_id: str) -> Optional[MaterialStyle]:
         """Get a registered style by ID"""
         return self.registered_styles.get(style_id)
     
+    def iter_styles(self) -> Iterator[MaterialStyle]:
+        """
+        Iterate over all registered styles without building a list.
+        
+        Like the other iter_* methods, this reads the registry directly, so
+        styles must not be registered while the iterator is in use.
+        """
+        return iter(self.registered_styles.values())
+    
+    def iter_styles_by_tag(self, tag: str) -> Iterator[MaterialStyle]:
+        """Iterate over the styles with a specific tag"""
+        return iter(self._by_tag.get(tag, {}).values())
+    
+    def iter_styles_for_game(self, game_id: str) -> Iterator[MaterialStyle]:
+        """Iterate over the styles compatible with a specific game"""
+        yield from self._all_game_styles.values()
+        yield from self._by_game.get(game_id, {}).values()
+    
     def get_all_styles(self) -> List[MaterialStyle]:
         """Get all registered styles"""
-        return list(self.registered_styles.values())
+        return list(self.iter_styles())
     
     def get_styles_by_tag(self, tag: str) -> List[MaterialStyle]:
         """Get all styles with a specific tag"""
-        return [
-            style for style in self.registered_styles.values()
-            if tag in style.tags
-        ]
+        return list(self.iter_styles_by_tag(tag))
     
     def get_styles_for_game(self, game_id: str) -> List[MaterialStyle]:
         """Get all styles compatible with a specific game"""
-        return [
-            style for style in self.registered_styles.values()
-            if not style.compatible_games or game_id in style.compatible_games
-        ]
+        return list(self.iter_styles_for_game(game_id))
     
     def register_style_mapping(self, source_game: str, target_game: str, source_style: str, target_style: str) -> None:
         """Register a style mapping between games"""
@@ -186,52 +341,61 @@ class MaterialStylesExtension:
             return {"success": False, "error": f"Style not found: {style_id}"}
             
         try:
-            # Get the current asset
-            asset_response = await self.sdk.chain.get_asset(asset_id)
-            if not asset_response.get("success", False):
-                return {"success": False, "error": "Failed to retrieve asset"}
-                
-            asset = asset_response.get("asset", {})
-            
-            # Update asset properties with style
-            # Note: This implementation assumes your blockchain supports asset updates
-            properties = asset.copy()
-            
-            # Apply style properties
-            if "primary_color" in style.color_overrides:
-                properties["primary_color"] = style.color_overrides["primary_color"].to_dict()
-                
-            if "secondary_color" in style.color_overrides:
-                properties["secondary_color"] = style.color_overrides["secondary_color"].to_dict()
-                
-            # Apply numeric parameters
-            if "numeric_properties" not in properties:
-                properties["numeric_properties"] = {}
-                
-            for key, value in style.numeric_parameters.items():
-                properties["numeric_properties"][key] = value
-                
-            # Apply string parameters
-            if "string_properties" not in properties:
-                properties["string_properties"] = {}
-                
-            for key, value in style.string_parameters.items():
-                properties["string_properties"][key] = value
-                
-            # Add style reference
-            if "string_properties" not in properties:
-                properties["string_properties"] = {}
+            async with self._slots():
+                if self._apply_style_supported:
+                    result = await self._apply_style_on_chain(asset_id, style_id, style)
+                    if result is not None:
+                        return result
+                        
+                # Get the current asset; update_asset reuses the cached copy for its diff
+                asset_response = await self.sdk.chain.get_asset(asset_id)
+                if not asset_response.get("success", False):
+                    return {"success": False, "error": "Failed to retrieve asset"}
+                    
+                metadata = asset_response.get("asset", {}).get("metadata") or {}
                 
-            properties["string_properties"]["applied_style"] = style_id
-            
-            # Update the asset on blockchain
-            update_response = await self.sdk.chain.update_asset(asset_id, properties)
-            
-            return update_response
+                # Only the properties the style sets; update_asset then sends just the ones that changed
+                patch = self._styled_properties(metadata, style, style_id)
+                return await self.sdk.chain.update_asset(asset_id, patch)
         except Exception as e:
             logger.error(f"Error applying style: {e}")
             return {"success": False, "error": str(e)}
     
+    @staticmethod
+    def _styled_properties(current: Dict[str, Any], style: MaterialStyle, style_id: str) -> Dict[str, Any]:
+        """
+        The asset properties a style sets, merged with an asset's current ones.
+        
+        The numeric and string property dicts are new dicts combining the
+        current values with the style's, so neither the asset's dicts nor
+        the style's cached patch are modified.
+        """
+        style_patch = style._style_patch()
+        properties = {key: style_patch[key] for key in ("primary_color", "secondary_color") if key in style_patch}
+        properties["numeric_properties"] = {
+            **current.get("numeric_properties", {}),
+            **style_patch["numeric_properties"]
+        }
+        properties["string_properties"] = {
+            **current.get("string_properties", {}),
+            **style_patch["string_properties"],
+            "applied_style": style_id
+        }
+        return properties
+    
+    async def _apply_style_on_chain(self, asset_id: str, style_id: str, style: MaterialStyle) -> Optional[Dict[str, Any]]:
+        """
+        Have the node merge the style into the asset in one request.
+        
+        Returns None if the node has no apply_style endpoint, so the caller
+        can fall back to reading and updating the asset itself.
+        """
+        patch = self._styled_properties({}, style, style_id)
+        result = await self.sdk.chain.apply_material_style(asset_id, style_id, patch)
+        if result is None:
+            self._apply_style_supported = False
+        return result
+    
     async def create_asset_with_style(self, owner_address: str, base_properties: Dict[str, Any], style_id: str) -> Dict[str, Any]:
         """Create a new asset with a style applied"""
         style = self.get_style(style_id)
@@ -240,35 +404,12 @@ class MaterialStylesExtension:
             return {"success": False, "error": f"Style not found: {style_id}"}
             
         try:
-            # Clone base properties
-            properties = base_properties.copy()
-            
-            # Apply style properties
-            if "primary_color" in style.color_overrides:
-                properties["primary_color"] = style.color_overrides["primary_color"].to_dict()
-                
-            if "secondary_color" in style.color_overrides:
-                properties["secondary_color"] = style.color_overrides["secondary_color"].to_dict()
-                
-            # Apply numeric parameters
-            if "numeric_properties" not in properties:
-                properties["numeric_properties"] = {}
-                
-            for key, value in style.numeric_parameters.items():
-                properties["numeric_properties"][key] = value
-                
-            # Apply string parameters
-            if "string_properties" not in properties:
-                properties["string_properties"] = {}
-                
-            for key, value in style.string_parameters.items():
-                properties["string_properties"][key] = value
-                
-            # Add style reference
-            properties["string_properties"]["applied_style"] = style_id
+            # Base properties with the style applied; the caller's dicts are left untouched
+            properties = {**base_properties, **self._styled_properties(base_properties, style, style_id)}
             
             # Create the asset on blockchain
-            return await self.sdk.chain.mint_asset(owner_address, properties)
+            async with self._slots():
+                return await self.sdk.chain.mint_asset(owner_address, properties)
         except Exception as e:
             logger.error(f"Error creating asset with style: {e}")
             return {"success": False, "error": str(e)}
\ No newline at end of file
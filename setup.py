@@ -1,8 +1,22 @@
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the asset (de)serialization module to a C extension with
+# mypyc (INTERVERSE_COMPILE=1 pip install .). The pure Python module is used
+# whenever the compiled one isn't built.
+ext_modules = []
+if os.environ.get("INTERVERSE_COMPILE", "").lower() in ("1", "true", "yes"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        ["--ignore-missing-imports", "--follow-imports=silent", "core/asset.py"],
+        opt_level="3",
+    )
+
 setup(
     name="interverse-sdk",
     version="0.1.0",
@@ -13,6 +27,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/FabianB14/InterverseSDK",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -29,8 +44,21 @@ setup(
         "aiohttp>=3.7.4",
         "websockets>=10.0",
         "requests>=2.25.1",
+        "cryptography>=3.1",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.6",
+            "msgpack>=1.0",
+            "msgspec>=0.18",
+            "uvloop>=0.15; sys_platform != 'win32'",
+        ],
+        "compile": [
+            "mypy>=1.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23",
+        ],
         "dev": [
             "pytest>=6.2.5",
             "pytest-asyncio>=0.15.1",
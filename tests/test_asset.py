@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from interverse.core.asset import InterverseAsset, ItemCategory
+
+PAYLOADS = [
+    {"asset_id": "a1", "owner": "wallet-a", "game_id": "g1", "category": "weapon", "rarity": "EPIC",
+     "level": 3, "model_id": "sword", "primary_color": {"r": 0.5, "g": 0.25, "b": 0, "a": 1},
+     "numeric_properties": {"damage": 12, "speed": 1.5}, "string_properties": {"element": "fire", "charges": 1},
+     "tags": ["melee"], "source_game": "g0", "conversion_history": [{"from_game": "g0", "to_game": "g1"}]},
+    {"asset_id": "a2", "category": 7, "rarity": "unknown", "level": "2"},
+    # Blockchain API format: from_dict ignores the metadata
+    {"asset_id": "a3", "owner": "wallet-b", "metadata": {"category": "weapon", "level": 4}},
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_from_bytes_matches_from_dict(payload):
+    asset = InterverseAsset.from_bytes(json.dumps(payload))
+
+    assert asset == InterverseAsset.from_dict(payload)
+
+
+def test_from_bytes_keeps_property_types():
+    asset = InterverseAsset.from_bytes(json.dumps(PAYLOADS[0]))
+
+    assert type(asset.numeric_properties["damage"]) is int
+    assert asset.string_properties["charges"] == 1
+
+
+def test_from_bytes_batch_matches_from_dict_batch():
+    assets = InterverseAsset.from_bytes_batch(json.dumps(PAYLOADS))
+
+    assert assets == InterverseAsset.from_dict_batch(PAYLOADS)
+    assert assets[2].category is ItemCategory.WEAPON
+
+
+def test_from_dict_batch_merges_metadata_of_blockchain_entries():
+    blockchain = {"asset_id": "a3", "owner": "wallet-b", "metadata": {"category": "weapon", "level": 4}}
+    own_format = {"asset_id": "a4", "category": "armor", "metadata": {"category": "weapon"}}
+
+    merged, plain = InterverseAsset.from_dict_batch([blockchain, own_format])
+
+    assert merged == InterverseAsset.from_blockchain_format(blockchain)
+    assert merged.category is ItemCategory.WEAPON and merged.level == 4
+    # Items that already have a category are read like from_dict
+    assert plain == InterverseAsset.from_dict(own_format)
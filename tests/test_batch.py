@@ -0,0 +1,44 @@
+import asyncio
+
+from interverse.core.batch import AsyncBatcher
+
+
+def test_batcher_coalesces_items_added_together():
+    batches = []
+
+    async def flush(items):
+        batches.append(items)
+        return [{"item": item} for item in items]
+
+    async def run():
+        batcher = AsyncBatcher(flush, max_size=8, wait_ms=1000)
+        return await asyncio.gather(*(batcher.add(n) for n in range(3)))
+
+    results = asyncio.run(run())
+
+    assert batches == [[0, 1, 2]]
+    assert results == [{"item": 0}, {"item": 1}, {"item": 2}]
+
+
+def test_lone_call_is_not_delayed_when_idle():
+    async def flush(items):
+        return items
+
+    async def run():
+        batcher = AsyncBatcher(flush, wait_ms=10000)
+        return await asyncio.wait_for(batcher.add("x"), timeout=1)
+
+    assert asyncio.run(run()) == "x"
+
+
+def test_flush_error_reaches_every_caller():
+    async def flush(items):
+        raise RuntimeError("node down")
+
+    async def run():
+        batcher = AsyncBatcher(flush)
+        return await asyncio.gather(batcher.add(1), batcher.add(2), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
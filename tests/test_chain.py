@@ -0,0 +1,186 @@
+import asyncio
+
+from interverse.core.chain import BALANCE_EVENT_WINDOW
+
+ASSET = {"id": "a1", "owner": "wallet-a", "metadata": {"level": 1, "name": "Sword"}}
+
+
+def test_update_asset_sends_changed_keys_with_etag(make_chain):
+    chain = make_chain({
+        ("GET", "/assets/a1"): [(200, ASSET, {"ETag": '"v1"'})],
+        ("PATCH", "/assets/a1"): [(200, None, {"ETag": '"v2"'})],
+    })
+
+    result = asyncio.run(chain._update_asset("a1", {"level": 2, "name": "Sword"}, retry=True))
+
+    assert result["success"]
+    assert result["asset"]["metadata"] == {"level": 2, "name": "Sword"}
+    _, _, body, headers = chain._request.calls[-1]
+    assert body == {"asset_id": "a1", "metadata": {"level": 2}}
+    assert headers == {"If-Match": '"v1"'}
+    assert chain._asset_cache.get("a1")[0] == '"v2"'
+
+
+def test_update_asset_refetches_and_retries_once_on_412(make_chain):
+    chain = make_chain({
+        ("GET", "/assets/a1"): [(200, ASSET, {"ETag": '"v1"'}), (200, ASSET, {"ETag": '"v2"'})],
+        ("PATCH", "/assets/a1"): [(412, None, {}), (412, None, {})],
+    })
+
+    result = asyncio.run(chain._update_asset("a1", {"level": 2}, retry=True))
+
+    assert chain._request.requests() == [
+        ("GET", "/assets/a1"), ("PATCH", "/assets/a1"),
+        ("GET", "/assets/a1"), ("PATCH", "/assets/a1"),
+    ]
+    assert chain._request.calls[-1][3] == {"If-Match": '"v2"'}
+    # The second conflict is reported instead of retrying forever
+    assert not result["success"]
+
+
+def test_update_asset_falls_back_to_put_then_transfer(make_chain):
+    chain = make_chain({
+        ("GET", "/assets/a1"): [(200, ASSET, {})],
+        ("PATCH", "/assets/a1"): [(405, None, {})],
+        ("PUT", "/assets/a1"): [(404, None, {})],
+        ("POST", "/assets/transfer"): [(200, {"asset_id": "a1"}, {})],
+    })
+
+    result = asyncio.run(chain._update_asset("a1", {"level": 2}, retry=True))
+
+    assert result["success"]
+    assert chain._request.requests() == [
+        ("GET", "/assets/a1"), ("PATCH", "/assets/a1"),
+        ("PUT", "/assets/a1"), ("POST", "/assets/transfer"),
+    ]
+    # PUT carries the full metadata, the transfer goes from the owner to itself
+    assert chain._request.calls[2][2]["metadata"] == {"level": 2, "name": "Sword"}
+    assert chain._request.calls[3][2] == {"asset_id": "a1", "from_address": "wallet-a", "to_address": "wallet-a"}
+    assert chain._asset_patch_supported is False
+
+
+def test_update_asset_skips_patch_once_unsupported(make_chain):
+    chain = make_chain({
+        ("GET", "/assets/a1"): [(200, ASSET, {})],
+        ("PUT", "/assets/a1"): [(200, None, {})],
+    })
+    chain._asset_patch_supported = False
+
+    result = asyncio.run(chain._update_asset("a1", {"level": 2}, retry=True))
+
+    assert result["success"]
+    assert chain._request.requests() == [("GET", "/assets/a1"), ("PUT", "/assets/a1")]
+
+
+def test_post_batch_uses_batch_route(make_chain):
+    chain = make_chain({
+        ("POST", "/assets/mint_batch"): [(200, [{"success": True, "data": {"n": 1}},
+                                                {"success": True, "data": {"n": 2}}], {})],
+    })
+
+    results = asyncio.run(chain._post_batch("/assets/mint", "Asset minting", [{"n": 1}, {"n": 2}]))
+
+    assert [result["data"] for result in results] == [{"n": 1}, {"n": 2}]
+    assert chain._request.requests() == [("POST", "/assets/mint_batch")]
+
+
+def test_post_batch_falls_back_to_single_requests_on_404(make_chain):
+    chain = make_chain({
+        ("POST", "/assets/mint_batch"): [(404, None, {})],
+        ("POST", "/assets/mint"): [(200, {"n": 1}, {}), (200, {"n": 2}, {}),
+                                   (200, {"n": 3}, {}), (200, {"n": 4}, {})],
+    })
+
+    async def run():
+        first = await chain._post_batch("/assets/mint", "Asset minting", [{"n": 1}, {"n": 2}])
+        second = await chain._post_batch("/assets/mint", "Asset minting", [{"n": 3}, {"n": 4}])
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert [result["data"] for result in first + second] == [{"n": 1}, {"n": 2}, {"n": 3}, {"n": 4}]
+    assert chain._batch_routes == {"/assets/mint": False}
+    # The missing route is only tried once
+    assert chain._request.requests().count(("POST", "/assets/mint_batch")) == 1
+
+
+def test_post_batch_failure_gives_each_payload_its_own_result(make_chain):
+    chain = make_chain({
+        ("POST", "/assets/mint_batch"): [(500, None, {})],
+    })
+
+    results = asyncio.run(chain._post_batch("/assets/mint", "Asset minting", [{"n": 1}, {"n": 2}]))
+
+    assert len(results) == 2
+    assert not results[0]["success"] and not results[1]["success"]
+    assert results[0] is not results[1]
+    assert "/assets/mint" not in chain._batch_routes
+
+
+def test_reads_reject_invalid_arguments_before_coalescing(make_chain):
+    chain = make_chain({})
+
+    async def run():
+        return (
+            await chain.get_balance(["not", "hashable"]),
+            await chain.get_asset({"id": 1}),
+            await chain.get_player_assets(None),
+        )
+
+    balance, asset, assets = asyncio.run(run())
+
+    assert balance == {"success": False, "error": "Invalid address"}
+    assert asset == {"success": False, "error": "Invalid asset ID"}
+    assert assets == {"success": False, "error": "Invalid address"}
+    assert chain._request.calls == []
+
+
+def test_concurrent_and_cached_reads_get_their_own_results(make_chain):
+    chain = make_chain({
+        ("GET", "/assets/a1"): [(200, dict(ASSET), {})],
+    })
+
+    async def run():
+        first, second = await asyncio.gather(chain.get_asset("a1"), chain.get_asset("a1"))
+        first["asset"]["owner"] = "someone-else"
+        first["extra"] = True
+        return second, await chain.get_asset("a1")
+
+    second, cached = asyncio.run(run())
+
+    assert chain._request.requests() == [("GET", "/assets/a1")]
+    assert "extra" not in second
+    assert second["asset"]["owner"] == "wallet-a"
+    assert cached["asset"]["owner"] == "wallet-a"
+
+
+def test_close_cancels_pending_balance_events(make_chain):
+    chain = make_chain({})
+    events = []
+    chain.on("balance_updated", events.append, inline=True)
+
+    async def run():
+        chain._on_ws_balance({"data": {"address": "wallet-a", "balance": 5}})
+        await chain.close()
+        await asyncio.sleep(BALANCE_EVENT_WINDOW * 2)
+
+    asyncio.run(run())
+
+    assert events == []
+    assert chain._balance_timers == {}
+
+
+def test_balance_pushes_are_coalesced(make_chain):
+    chain = make_chain({})
+    events = []
+    chain.on("balance_updated", events.append, inline=True)
+
+    async def run():
+        for balance in (1, 2, 3):
+            chain._on_ws_balance({"data": {"address": "wallet-a", "balance": balance}})
+        await asyncio.sleep(BALANCE_EVENT_WINDOW * 2)
+
+    asyncio.run(run())
+
+    assert events == [{"address": "wallet-a", "balance": 3}]
+    assert chain._balance_timers == {}
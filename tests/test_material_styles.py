@@ -0,0 +1,80 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from interverse.extensions.material_styles.material_extension import MaterialStyle, MaterialStylesExtension
+
+STYLE = MaterialStyle(id="fire", name="Fire", numeric_parameters={"glow": 0.8})
+ASSET = {"id": "a1", "owner": "wallet-a", "metadata": {"numeric_properties": {"glow": 0.1}}}
+
+
+def make_extension(chain):
+    extension = MaterialStylesExtension(SimpleNamespace(chain=chain))
+    asyncio.run(extension.register_style(STYLE))
+    return extension
+
+
+def test_apply_style_uses_server_side_endpoint(make_chain):
+    chain = make_chain({
+        ("POST", "/verse/assets/a1/apply_style"): [(200, {"id": "a1"}, {})],
+    })
+    extension = make_extension(chain)
+
+    result = asyncio.run(extension.apply_style_to_asset("a1", "fire"))
+
+    assert result == {"success": True, "asset": {"id": "a1"}}
+    assert chain._request.calls[0][2]["style_id"] == "fire"
+
+
+def test_unknown_asset_does_not_disable_server_side_path(make_chain):
+    not_found = json.dumps({"success": False, "message": "Asset not found"})
+    chain = make_chain({
+        ("POST", "/verse/assets/missing/apply_style"): [(404, not_found, {})],
+        ("POST", "/verse/assets/a1/apply_style"): [(200, {"id": "a1"}, {})],
+    })
+    extension = make_extension(chain)
+
+    async def run():
+        return (
+            await extension.apply_style_to_asset("missing", "fire"),
+            await extension.apply_style_to_asset("a1", "fire"),
+        )
+
+    missing, found = asyncio.run(run())
+
+    assert not missing["success"]
+    assert extension._apply_style_supported
+    assert found["success"]
+    assert chain._request.requests() == [
+        ("POST", "/verse/assets/missing/apply_style"), ("POST", "/verse/assets/a1/apply_style"),
+    ]
+
+
+def test_missing_endpoint_falls_back_to_update(make_chain):
+    chain = make_chain({
+        ("POST", "/verse/assets/a1/apply_style"): [(404, "<h1>Not Found</h1>", {})],
+        ("GET", "/assets/a1"): [(200, ASSET, {})],
+        ("PATCH", "/assets/a1"): [(200, None, {})],
+    })
+    extension = make_extension(chain)
+
+    result = asyncio.run(extension.apply_style_to_asset("a1", "fire"))
+
+    assert result["success"]
+    assert not extension._apply_style_supported
+    assert chain._request.calls[-1][2]["metadata"]["numeric_properties"] == {"glow": 0.8}
+
+
+def test_register_styles_falls_back_to_single_registrations(make_chain):
+    chain = make_chain({
+        ("POST", "/verse/material_styles/register_batch"): [(404, "", {})],
+        ("POST", "/verse/material_styles/register"): [(200, {}, {}), (200, {}, {})],
+    })
+    chain.is_connected = True
+    extension = MaterialStylesExtension(SimpleNamespace(chain=chain))
+    ice = MaterialStyle(id="ice", name="Ice")
+
+    assert asyncio.run(extension.register_styles([STYLE, ice]))
+
+    assert not extension._batch_register_supported
+    assert [call[2]["id"] for call in chain._request.calls[1:]] == ["fire", "ice"]
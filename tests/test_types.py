@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from interverse.core.types import Transaction, TransactionStatus, TransactionType
+
+PAYLOADS = [
+    {"id": "tx1", "sender_address": "a", "recipient_address": "b", "amount": 2.5,
+     "transaction_type": "mint", "status": "COMPLETED", "timestamp": "2024-01-02T03:04:05",
+     "metadata": {"note": "x"}, "block_number": 7},
+    {"id": 5, "transaction_type": None, "status": None, "timestamp": 1700000000},
+    {"id": None, "amount": "3", "transaction_type": 4, "status": "unknown",
+     "timestamp": "2024-01-02T03:04:05Z", "metadata": None},
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_from_bytes_matches_from_dict(payload):
+    expected = Transaction.from_dict(payload)
+
+    assert Transaction.from_bytes(json.dumps(payload)) == expected
+    assert Transaction.from_bytes_batch(json.dumps([payload, payload])) == [expected, expected]
+
+
+def test_loose_fields_are_normalized():
+    transaction = Transaction.from_bytes(json.dumps(PAYLOADS[1]))
+
+    assert transaction.id == "5"
+    assert transaction.transaction_type is TransactionType.TRANSFER
+    assert transaction.status is TransactionStatus.PENDING
@@ -0,0 +1,82 @@
+import asyncio
+
+from interverse.core.wallet import InterverseWallet, WalletManager, WalletStorage
+
+ADDRESS = "wallet-a"
+
+
+def make_history():
+    return [
+        {"id": "tx1", "type": "TRANSFER", "sender": "wallet-b", "recipient": ADDRESS,
+         "amount": 10, "timestamp": 1},
+        {"id": "tx2", "type": "TRANSFER", "sender": ADDRESS, "recipient": "wallet-b",
+         "amount": 3, "timestamp": 2},
+        # No id: keyed by its content instead
+        {"type": "MINT", "sender": "", "recipient": ADDRESS, "amount": 5, "timestamp": 3},
+    ]
+
+
+class FakeChain:
+    def __init__(self, transactions):
+        self.transactions = transactions
+
+    async def get_transaction_history(self, address):
+        return {"success": True, "transactions": [dict(tx) for tx in self.transactions]}
+
+
+def test_add_transactions_applies_each_transaction_once():
+    wallet = InterverseWallet(address=ADDRESS)
+
+    assert wallet.add_transactions(make_history()) == 3
+    assert wallet.balance == 12
+
+    # Refetching the same history must not change the balance again
+    assert wallet.add_transactions(make_history()) == 0
+    assert wallet.balance == 12
+    assert len(wallet.transactions) == 3
+
+
+def test_transactions_without_id_are_told_apart_by_content():
+    wallet = InterverseWallet(address=ADDRESS)
+    first = {"type": "MINT", "recipient": ADDRESS, "amount": 5, "timestamp": 1}
+    second = {"type": "MINT", "recipient": ADDRESS, "amount": 5, "timestamp": 2}
+
+    assert wallet.add_transactions([first, second, dict(first)]) == 2
+    assert wallet.balance == 10
+
+
+def test_update_wallet_transactions_returns_new_count(tmp_path):
+    chain = FakeChain(make_history())
+    manager = WalletManager(chain, storage_dir=str(tmp_path))
+    wallet = InterverseWallet(address=ADDRESS)
+
+    assert asyncio.run(manager._update_wallet_transactions(wallet)) == 3
+
+    chain.transactions.append(
+        {"id": "tx3", "type": "TRANSFER", "sender": "wallet-b", "recipient": ADDRESS,
+         "amount": 1, "timestamp": 4}
+    )
+    assert asyncio.run(manager._update_wallet_transactions(wallet)) == 1
+    assert wallet.balance == 13
+
+
+def test_encrypted_round_trip_clears_key_cache(tmp_path):
+    storage = WalletStorage(str(tmp_path))
+    wallet = InterverseWallet(address=ADDRESS, balance=4.5, private_key="secret")
+    storage.wallets[ADDRESS] = wallet
+
+    assert storage.save_all("hunter2") == 1
+    assert storage._key_cache == {}
+
+    reloaded = WalletStorage(str(tmp_path))
+    assert reloaded.load_wallets("hunter2") == 1
+    assert reloaded._key_cache == {}
+    assert reloaded.get_wallet(ADDRESS).balance == 4.5
+    assert reloaded.get_wallet(ADDRESS)._private_key == "secret"
+
+
+def test_save_wallet_does_not_keep_derived_key(tmp_path):
+    storage = WalletStorage(str(tmp_path))
+
+    assert storage.save_wallet(InterverseWallet(address=ADDRESS), "hunter2")
+    assert storage._key_cache == {}